@@ -0,0 +1,35 @@
+import pytest
+import swmmio as sw
+
+
+@pytest.fixture(scope="session")
+def model():
+    """
+    A pytest fixture that creates and provides a SWMM Model object using the TEST_FILE.
+
+    The fixture has a session scope, meaning the INP and RPT files are parsed only once,
+    and the same SWMM Model object will be shared by all test modules. Tests must not mutate it;
+    data classes take their own copies of the model dataframes.
+
+    Yields:
+        sw.Model: The SWMM Model object created from the TEST_FILE.
+    """
+    # Imported here, so collecting tests which do not use the model does not import the inp_manage package.
+    from stormwater_analysis.inp_manage.test_inp import TEST_FILE
+
+    yield sw.Model(TEST_FILE, include_rpt=True)
+
+
+@pytest.fixture(scope="session")
+def max_slopes_realized():
+    """
+    A pytest fixture that provides the maximum slopes of the standard pipe diameters as a plain dictionary.
+
+    The slopes are calculated once per session, so tests index a dictionary instead of going through `max_slopes`.
+
+    Yields:
+        dict: The maximum slope [‰] keyed by the diameter as a string, e.g. "0.5".
+    """
+    from stormwater_analysis.pipes.round import get_max_slopes
+
+    yield dict(get_max_slopes())
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,12 +21,149 @@ pd.set_option("display.width", desired_width)
 np.set_printoptions(linewidth=desired_width)
 pd.set_option("display.max_columns", 30)
 
+# Columns of swmmio's conduits dataframe which are used by the analysis.
+_CONDUITS_COLUMNS = [
+    "Name",
+    "InletNode",
+    "OutletNode",
+    "Length",
+    "Geom1",
+    "MaxV",
+    "MaxDPerc",
+    "InletNodeInvert",
+    "OutletNodeInvert",
+    "SlopeFtPerFt",
+]
+
+# Columns of swmmio's nodes dataframe which are used by the analysis.
+_NODES_COLUMNS = [
+    "InvertElev",
+    "MaxDepth",
+]
+
+# Columns of swmmio's subcatchments dataframe which the land use classifier reads.
+_CLASSIFIER_COLUMNS = [
+    "Area",
+    "PercImperv",
+    "Width",
+    "PercSlope",
+    "PctZero",
+    "TotalPrecip",
+    "TotalRunoffMG",
+    "PeakRunoff",
+    "RunoffCoeff",
+]
+
+# Columns of swmmio's subcatchments dataframe which are used by the analysis.
+_SUBCATCHMENTS_COLUMNS = ["Outlet", *_CLASSIFIER_COLUMNS]
+
+
+def _outlet_max_depth(inlet: np.ndarray, length: np.ndarray, slope: np.ndarray, outlet: np.ndarray) -> np.ndarray:
+    """
+    Fills missing outlet depths with the inlet depth lowered by the conduit fall.
+
+    Args:
+        inlet (np.ndarray): Inlet max depths.
+        length (np.ndarray): Conduit lengths.
+        slope (np.ndarray): Conduit slopes.
+        outlet (np.ndarray): Outlet max depths, NaN where unknown.
+
+    Returns:
+        np.ndarray: Outlet max depths with the NaN entries calculated.
+    """
+    return np.where(np.isnan(outlet), inlet - length * slope, outlet)
+
+
+def _ground_elevation(invert: np.ndarray, max_depth: np.ndarray) -> np.ndarray:
+    """
+    Calculates the ground elevation above a conduit end.
+
+    Args:
+        invert (np.ndarray): Node invert elevations.
+        max_depth (np.ndarray): Node max depths.
+
+    Returns:
+        np.ndarray: Ground elevations.
+    """
+    return invert + max_depth
+
+
+def _ground_cover(
+    inlet_ground_elevation: np.ndarray,
+    outlet_ground_elevation: np.ndarray,
+    inlet_invert: np.ndarray,
+    outlet_invert: np.ndarray,
+    diameter: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the ground cover over the inlet and outlet of conduits.
+
+    Args:
+        inlet_ground_elevation (np.ndarray): Ground elevations above the inlets.
+        outlet_ground_elevation (np.ndarray): Ground elevations above the outlets.
+        inlet_invert (np.ndarray): Inlet node invert elevations.
+        outlet_invert (np.ndarray): Outlet node invert elevations.
+        diameter (np.ndarray): Conduit diameters.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The inlet and outlet ground covers.
+    """
+    return inlet_ground_elevation - inlet_invert - diameter, outlet_ground_elevation + outlet_invert - diameter
+
+
+def _depth_ok(
+    inlet_invert: np.ndarray,
+    outlet_invert: np.ndarray,
+    inlet_ground_elevation: np.ndarray,
+    outlet_ground_elevation: np.ndarray,
+) -> np.ndarray:
+    """
+    Checks the depth of conduits against the maximum depth.
+
+    Args:
+        inlet_invert (np.ndarray): Inlet node invert elevations.
+        outlet_invert (np.ndarray): Outlet node invert elevations.
+        inlet_ground_elevation (np.ndarray): Ground elevations above the inlets.
+        outlet_ground_elevation (np.ndarray): Ground elevations above the outlets.
+
+    Returns:
+        np.ndarray: True where the depth of both conduit ends is valid.
+    """
+    return (inlet_invert - max_depth_value <= inlet_ground_elevation) & (
+        outlet_invert - max_depth_value <= outlet_ground_elevation
+    )
+
+
+def _coverage_ok(inlet_ground_cover: np.ndarray, outlet_ground_cover: np.ndarray, frost_zone: float) -> np.ndarray:
+    """
+    Checks the ground cover of conduits against the freezing depth.
+
+    Args:
+        inlet_ground_cover (np.ndarray): Ground covers over the inlets.
+        outlet_ground_cover (np.ndarray): Ground covers over the outlets.
+        frost_zone (float): The freezing depth [m].
+
+    Returns:
+        np.ndarray: True where the ground cover over both conduit ends is valid.
+    """
+    return (inlet_ground_cover >= frost_zone) & (outlet_ground_cover >= frost_zone)
+
 
 class Data(ABC):
     """
     Abstract base class for data classes.
     """
 
+    # Freezing depth [m] for each frost zone category.
+    _FROST_ZONES = MappingProxyType(
+        {
+            "I": 1,
+            "II": 1.2,
+            "III": 1.4,
+            "IV": 1.6,
+        }
+    )
+
     def __init__(self, model: sw.Model) -> None:
         self.model = model
 
@@ -52,9 +191,11 @@ class ConduitsData(Data):
 
     def __init__(self, model: sw.Model) -> None:
         super().__init__(model)
-        self.conduits = model.conduits().copy()
+        self.conduits = model.conduits().loc[:, _CONDUITS_COLUMNS].copy()
         self.frost_zone = None
         self.conduits.set_index("Name", inplace=True)
+        # Node IDs repeat across conduits; categories store each ID once and speed up comparisons and lookups.
+        self.conduits = self.conduits.astype({"InletNode": "category", "OutletNode": "category"})
 
     def set_frost_zone(self, frost_zone: str) -> None:
         """
@@ -69,13 +210,7 @@ class ConduitsData(Data):
             frost_zone (str): A string representing the frost zone category, e.g., "I", "II", "III", "IV".
 
         """
-        categories = {
-            "I": 1,
-            "II": 1.2,
-            "III": 1.4,
-            "IV": 1.6,
-        }
-        self.frost_zone = categories.get(frost_zone.upper(), 1.2)  # type: ignore
+        self.frost_zone = self._FROST_ZONES.get(frost_zone.strip().upper(), 1.2)  # type: ignore
 
     def get_tag(self):  # type: ignore
         pass
@@ -83,8 +218,11 @@ class ConduitsData(Data):
     def drop_unused(self) -> None:
         """
         Drops unused columns from the conduits dataframe.
+
+        The dataframe is already built from the used columns only, so this only matters
+        when `conduits` has been replaced with a full swmmio dataframe.
         """
-        self.conduits = self.conduits.drop(
+        self.conduits.drop(
             columns=[
                 "OutOffset",
                 "InitFlow",
@@ -95,7 +233,9 @@ class ConduitsData(Data):
                 "Geom2",
                 "Geom3",
                 "Geom4",
-            ]
+            ],
+            inplace=True,
+            errors="ignore",
         )
 
     def calculate_conduit_filling(self) -> None:
@@ -111,7 +251,10 @@ class ConduitsData(Data):
         Checks the filling of each conduit in the dataframe against its corresponding diameter.
         Adds a new column "ValMaxFill" to the dataframe indicating if the filling is valid (1) or invalid (0).
         """
-        self.conduits["ValMaxFill"] = self.conduits.apply(lambda df: validate_filling(df.Filling, df.Geom1), axis=1).astype(int)
+        self.conduits["ValMaxFill"] = self.conduits.apply(
+            lambda df: validate_filling(df.Filling, df.Geom1),
+            axis=1,
+        ).astype(np.int8)
 
     def velocity_is_valid(self) -> None:
         """
@@ -120,8 +263,8 @@ class ConduitsData(Data):
         ValMaxV (1 if MaxV <= max_velocity_value, 0 otherwise) and
         ValMinV (1 if MaxV >= min_velocity_value, 0 otherwise).
         """
-        self.conduits["ValMaxV"] = self.conduits.apply(lambda df: validate_max_velocity(df.MaxV), axis=1).astype(int)
-        self.conduits["ValMinV"] = self.conduits.apply(lambda df: validate_min_velocity(df.MaxV), axis=1).astype(int)
+        self.conduits["ValMaxV"] = self.conduits.apply(lambda df: validate_max_velocity(df.MaxV), axis=1).astype(np.int8)
+        self.conduits["ValMinV"] = self.conduits.apply(lambda df: validate_min_velocity(df.MaxV), axis=1).astype(np.int8)
 
     def slope_per_mile(self) -> None:
         """
@@ -140,7 +283,7 @@ class ConduitsData(Data):
         self.conduits["ValMaxSlope"] = self.conduits.apply(
             lambda df: validate_max_slope(slope=df.SlopeFtPerFt * 1000, diameter=df.Geom1),
             axis=1,
-        ).astype(int)
+        ).astype(np.int8)
         self.conduits["ValMinSlope"] = self.conduits.apply(
             lambda df: validate_min_slope(
                 slope=df.SlopeFtPerFt * 1000,
@@ -148,7 +291,7 @@ class ConduitsData(Data):
                 diameter=df.Geom1,
             ),
             axis=1,
-        ).astype(int)
+        ).astype(np.int8)
 
     def max_depth(self) -> None:
         """
@@ -156,8 +299,58 @@ class ConduitsData(Data):
         using the 'InletNode' values to match the corresponding rows. A new 'MaxDepth' column is
         added to the 'conduits' DataFrame containing the copied values.
         """
-        self.conduits["InletMaxDepth"] = self.conduits["InletNode"].map(self.model.nodes.dataframe["MaxDepth"])
-        self.conduits["OutletMaxDepth"] = self.conduits["OutletNode"].map(self.model.nodes.dataframe["MaxDepth"])
+        # swmmio rebuilds the nodes dataframe from the .inp file on every access, so read it once.
+        nodes_max_depth = self.model.nodes.dataframe["MaxDepth"]
+        self.conduits["InletMaxDepth"] = nodes_max_depth.reindex(self.conduits["InletNode"]).to_numpy()
+        self.conduits["OutletMaxDepth"] = nodes_max_depth.reindex(self.conduits["OutletNode"]).to_numpy()
+
+    def compute_depth_block(self) -> None:
+        """
+        Calculates all depth related columns of the conduits in a single pass.
+
+        Equivalent to calling `max_depth`, `calculate_max_depth`, `ground_elevation`, `ground_cover`,
+        `depth_is_valid` and `coverage_is_valid` in sequence, but reads the input columns once and
+        works on numpy arrays instead of re-scanning the dataframe in every step.
+        """
+        conduits = self.conduits
+        nodes_max_depth = self.model.nodes.dataframe["MaxDepth"]
+        inlet_max_depth = nodes_max_depth.reindex(conduits["InletNode"]).to_numpy(dtype=np.float64)
+        outlet_max_depth = nodes_max_depth.reindex(conduits["OutletNode"]).to_numpy(dtype=np.float64)
+
+        inlet_invert = conduits["InletNodeInvert"].to_numpy(dtype=np.float64)
+        outlet_invert = conduits["OutletNodeInvert"].to_numpy(dtype=np.float64)
+        diameter = conduits["Geom1"].to_numpy(dtype=np.float64)
+        outlet_max_depth = _outlet_max_depth(
+            inlet_max_depth,
+            conduits["Length"].to_numpy(dtype=np.float64),
+            conduits["SlopeFtPerFt"].to_numpy(dtype=np.float64),
+            outlet_max_depth,
+        )
+
+        inlet_ground_elevation = _ground_elevation(inlet_invert, inlet_max_depth)
+        outlet_ground_elevation = _ground_elevation(outlet_invert, outlet_max_depth)
+        inlet_ground_cover, outlet_ground_cover = _ground_cover(
+            inlet_ground_elevation, outlet_ground_elevation, inlet_invert, outlet_invert, diameter
+        )
+        depth_ok = _depth_ok(inlet_invert, outlet_invert, inlet_ground_elevation, outlet_ground_elevation)
+        cov_ok = _coverage_ok(inlet_ground_cover, outlet_ground_cover, self.frost_zone)  # type: ignore
+
+        block = {
+            "InletMaxDepth": inlet_max_depth,
+            "OutletMaxDepth": outlet_max_depth,
+            "InletGroundElevation": inlet_ground_elevation,
+            "OutletGroundElevation": outlet_ground_elevation,
+            "InletGroundCover": inlet_ground_cover,
+            "OutletGroundCover": outlet_ground_cover,
+            "ValDepth": depth_ok.astype(np.int8),
+            "ValCoverage": cov_ok.astype(np.int8),
+        }
+        # Columns from an earlier run are overwritten in place; new ones are added in a single concat
+        # instead of one insert per column, which would fragment the dataframe's blocks.
+        new_columns = {column: values for column, values in block.items() if column not in conduits.columns}
+        for column in block.keys() - new_columns.keys():
+            conduits[column] = block[column]
+        self.conduits = pd.concat([conduits, pd.DataFrame(new_columns, index=conduits.index)], axis=1)
 
     def calculate_max_depth(self) -> None:
         """
@@ -167,9 +360,12 @@ class ConduitsData(Data):
         For those rows, it calculates the outlet depth by subtracting the product of the conduit's length and slope
         from the inlet depth. The resulting values are then written to the 'OutletMaxDepth' column for those rows.
         """
-        nan_rows = pd.isna(self.conduits.OutletMaxDepth)
-        self.conduits.loc[nan_rows, "OutletMaxDepth"] = self.conduits.loc[nan_rows, "InletMaxDepth"] - (
-            self.conduits.loc[nan_rows, "Length"] * self.conduits.loc[nan_rows, "SlopeFtPerFt"]
+        conduits = self.conduits
+        conduits["OutletMaxDepth"] = _outlet_max_depth(
+            conduits["InletMaxDepth"].to_numpy(dtype=np.float64),
+            conduits["Length"].to_numpy(dtype=np.float64),
+            conduits["SlopeFtPerFt"].to_numpy(dtype=np.float64),
+            conduits["OutletMaxDepth"].to_numpy(dtype=np.float64),
         )
 
     def ground_elevation(self) -> None:
@@ -180,8 +376,13 @@ class ConduitsData(Data):
         elevation to determine the amount of ground cover over the inlet and outlet, respectively. The results
         are stored in the 'InletGroundElevation' and 'OutletGroundElevation' columns of the 'conduits' dataframe.
         """
-        self.conduits["InletGroundElevation"] = self.conduits.InletNodeInvert + self.conduits.InletMaxDepth
-        self.conduits["OutletGroundElevation"] = self.conduits.OutletNodeInvert + self.conduits.OutletMaxDepth
+        conduits = self.conduits
+        conduits["InletGroundElevation"] = _ground_elevation(
+            conduits["InletNodeInvert"].to_numpy(dtype=np.float64), conduits["InletMaxDepth"].to_numpy(dtype=np.float64)
+        )
+        conduits["OutletGroundElevation"] = _ground_elevation(
+            conduits["OutletNodeInvert"].to_numpy(dtype=np.float64), conduits["OutletMaxDepth"].to_numpy(dtype=np.float64)
+        )
 
     def ground_cover(self) -> None:
         """
@@ -191,11 +392,13 @@ class ConduitsData(Data):
         elevation to determine the amount of ground cover over the inlet and outlet, respectively. The results
         are stored in the 'InletGroundElevation' and 'OutletGroundElevation' columns of the 'conduits' dataframe.
         """
-        self.conduits["InletGroundCover"] = (
-            self.conduits.InletGroundElevation - self.conduits.InletNodeInvert - self.conduits.Geom1
-        )
-        self.conduits["OutletGroundCover"] = (
-            self.conduits.OutletGroundElevation + self.conduits.OutletNodeInvert - self.conduits.Geom1
+        conduits = self.conduits
+        conduits["InletGroundCover"], conduits["OutletGroundCover"] = _ground_cover(
+            conduits["InletGroundElevation"].to_numpy(dtype=np.float64),
+            conduits["OutletGroundElevation"].to_numpy(dtype=np.float64),
+            conduits["InletNodeInvert"].to_numpy(dtype=np.float64),
+            conduits["OutletNodeInvert"].to_numpy(dtype=np.float64),
+            conduits["Geom1"].to_numpy(dtype=np.float64),
         )
 
     def depth_is_valid(self) -> None:
@@ -212,10 +415,13 @@ class ConduitsData(Data):
         invert elevation minus the maximum depth and the outlet ground
         cover elevation.
         """
-        self.conduits["ValDepth"] = (
-            ((self.conduits.InletNodeInvert - max_depth_value) <= self.conduits.InletGroundElevation)
-            & ((self.conduits.OutletNodeInvert - max_depth_value) <= self.conduits.OutletGroundElevation)
-        ).astype(int)
+        conduits = self.conduits
+        conduits["ValDepth"] = _depth_ok(
+            conduits["InletNodeInvert"].to_numpy(dtype=np.float64),
+            conduits["OutletNodeInvert"].to_numpy(dtype=np.float64),
+            conduits["InletGroundElevation"].to_numpy(dtype=np.float64),
+            conduits["OutletGroundElevation"].to_numpy(dtype=np.float64),
+        ).astype(np.int8)
 
     def coverage_is_valid(self) -> None:
         """
@@ -229,15 +435,18 @@ class ConduitsData(Data):
         zone depth. The 'frost_zone' parameter used in the
         calculations is specified in the class constructor.
         """
-        self.conduits["ValCoverage"] = (
-            (self.conduits.InletGroundCover >= self.frost_zone) & (self.conduits.OutletGroundCover >= self.frost_zone)
-        ).astype(int)
+        conduits = self.conduits
+        conduits["ValCoverage"] = _coverage_ok(
+            conduits["InletGroundCover"].to_numpy(dtype=np.float64),
+            conduits["OutletGroundCover"].to_numpy(dtype=np.float64),
+            self.frost_zone,  # type: ignore
+        ).astype(np.int8)
 
 
 class NodesData(Data):
     def __init__(self, model: sw.Model) -> None:
         super().__init__(model)
-        self.nodes = model.nodes.dataframe.copy()
+        self.nodes = model.nodes.dataframe.loc[:, _NODES_COLUMNS].copy()
         self.frost_zone = None
 
     def set_frost_zone(self, frost_zone: str) -> None:
@@ -253,22 +462,26 @@ class NodesData(Data):
             frost_zone (str): A string representing the frost zone category, e.g., "I", "II", "III", "IV".
 
         """
-        categories = {
-            "I": 1,
-            "II": 1.2,
-            "III": 1.4,
-            "IV": 1.6,
-        }
-        self.frost_zone = categories.get(frost_zone.upper(), 1.2)  # type: ignore
+        self.frost_zone = self._FROST_ZONES.get(frost_zone.strip().upper(), 1.2)  # type: ignore
 
     def drop_unused(self) -> None:
         """
         Drops unused columns from the nodes dataframe.
+
+        The dataframe is already built from the used columns only, so this only matters
+        when `nodes` has been replaced with a full swmmio dataframe.
         """
-        self.nodes = self.nodes.drop(
+        self.nodes.drop(
             columns=[
-                #
-            ]
+                "InitDepth",
+                "SurchargeDepth",
+                "PondedArea",
+                "OutfallType",
+                "StageOrTimeseries",
+                "coords",
+            ],
+            inplace=True,
+            errors="ignore",
         )
 
     # TODO calculate MAxDepth for outlets
@@ -301,7 +514,8 @@ class SubcatchmentsData(Data):
 
     def __init__(self, model: sw.Model) -> None:
         super().__init__(model)
-        self.subcatchments = model.subcatchments.dataframe.copy()
+        # The report columns are missing when the model is read without its .rpt file, so they are not required.
+        self.subcatchments = model.subcatchments.dataframe.filter(items=_SUBCATCHMENTS_COLUMNS).copy()
         self.frost_zone = None
 
     def set_frost_zone(self, frost_zone: str) -> None:
@@ -311,28 +525,38 @@ class SubcatchmentsData(Data):
         Args:
             frost_zone (str): A string representing the frost zone category, e.g., "I", "II", "III", "IV".
         """
-        categories = {
-            "I": 1,
-            "II": 1.2,
-            "III": 1.4,
-            "IV": 1.6,
-        }
-        self.frost_zone = categories.get(frost_zone.upper(), 1.2)  # type: ignore
+        self.frost_zone = self._FROST_ZONES.get(frost_zone.strip().upper(), 1.2)  # type: ignore
 
     def drop_unused(self) -> None:
         """
         Drops unused columns from the subcatchments dataframe.
+
+        The dataframe is already built from the used columns only, so this only matters
+        when `subcatchments` has been replaced with a full swmmio dataframe.
         """
-        self.subcatchments = self.subcatchments.drop(
+        self.subcatchments.drop(
             columns=[
-                #
-            ]
+                "Raingage",
+                "CurbLength",
+                "N-Imperv",
+                "N-Perv",
+                "S-Imperv",
+                "S-Perv",
+                "RouteTo",
+                "TotalRunon",
+                "TotalEvap",
+                "TotalInfil",
+                "ImpervRunoff",
+                "PervRunoff",
+                "TotalRunoffIn",
+                "coords",
+            ],
+            inplace=True,
+            errors="ignore",
         )
 
     def classify(self, categories: bool = True) -> None:
-        df = self.subcatchments[
-            ["Area", "PercImperv", "Width", "PercSlope", "PctZero", "TotalPrecip", "TotalRunoffMG", "PeakRunoff", "RunoffCoeff"]
-        ].copy()
+        df = self.subcatchments[_CLASSIFIER_COLUMNS].copy()
         df["TotalPrecip"] = pd.to_numeric(df["TotalPrecip"])
         predictions = classifier.predict(df)
         predictions_cls = predictions.argmax(axis=-1)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
 import swmmio
@@ -35,13 +36,8 @@ def perform_conduits_feature_engineering(model: swmmio.Model) -> ConduitsData:
     conduits_data.filling_is_valid()
     conduits_data.velocity_is_valid()
     conduits_data.slopes_is_valid()
-    conduits_data.max_depth()
     conduits_data.slope_per_mile()
-    conduits_data.calculate_max_depth()
-    conduits_data.ground_elevation()
-    conduits_data.ground_cover()
-    conduits_data.depth_is_valid()
-    conduits_data.coverage_is_valid()
+    conduits_data.compute_depth_block()
     return conduits_data
 
 
@@ -100,13 +96,20 @@ def feature_engineering(
     - Performs feature engineering on the nodes data.
     - Performs feature engineering on the subcatchments data.
 
+    The three steps work on separate dataframes, so they are run concurrently in a thread pool.
+
     Returns:
         tuple: A tuple containing three processed data objects: (conduits_data, nodes_data, subcatchments_data), where
             - conduits_data (ConduitsData): The processed conduits data after feature engineering.
             - nodes_data (NodesData): The processed nodes data after feature engineering.
             - subcatchments_data (SubcatchmentsData): The processed subcatchments data after feature engineering.
     """
-    conduits_data = perform_conduits_feature_engineering(model)
-    nodes_data = perform_nodes_feature_engineering(model)
-    subcatchments_data = perform_subcatchments_feature_engineering(model)
-    return conduits_data, nodes_data, subcatchments_data
+    # swmmio creates its model sections lazily; build them up front so the workers only read shared state.
+    model.conduits()
+    _ = model.nodes, model.subcatchments
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        conduits_future = executor.submit(perform_conduits_feature_engineering, model)
+        nodes_future = executor.submit(perform_nodes_feature_engineering, model)
+        subcatchments_future = executor.submit(perform_subcatchments_feature_engineering, model)
+    return conduits_future.result(), nodes_future.result(), subcatchments_future.result()
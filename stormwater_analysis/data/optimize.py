@@ -4,11 +4,10 @@ Trying to build genetic algorithm to optimize conduits network.
 
 
 from random import choices, randint, random, uniform
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from feature_engineering import conduits_data
 
 
 def crossover(parent1: List[float], parent2: List[float]) -> Tuple[List[float], List[float]]:
@@ -87,14 +86,32 @@ class GeneticAlgorithm:
         total_slope = np.sum(np.array(individual) * self.conduits_data["SlopePerMile"])
         return abs(total_slope)  # Ensure positive fitness values
 
-    def selection(self) -> List[List[float]]:
+    def fitness_all(self) -> np.ndarray:
+        """
+        Computes the fitness of every individual in the current population in a single pass.
+
+        Like the pandas sum in `fitness`, NaN genes and slopes count as 0, so no score is NaN.
+
+        Returns:
+            np.ndarray: The fitness scores, in the same order as the population.
+        """
+        population = np.nan_to_num(np.asarray(self.population, dtype=np.float64), nan=0.0)
+        slopes = np.nan_to_num(self.conduits_data["SlopePerMile"].to_numpy(dtype=np.float64), nan=0.0)
+        return np.abs(population @ slopes)
+
+    def selection(self, fitness_scores: Optional[np.ndarray] = None) -> List[List[float]]:
         """
         Selects individuals from the current population to create the mating pool.
 
+        Args:
+            fitness_scores (Optional[np.ndarray]): Precomputed fitness of the current population.
+                Computed with `fitness_all` when not given.
+
         Returns:
             List[List[float]]: The mating pool.
         """
-        fitness_scores = [self.fitness(individual) for individual in self.population]
+        if fitness_scores is None:
+            fitness_scores = self.fitness_all()
         return choices(self.population, weights=fitness_scores, k=len(self.population))
 
     def run(self) -> Tuple[List[float], float]:
@@ -105,8 +122,10 @@ class GeneticAlgorithm:
             Tuple[List[float], float]: The best individual and its fitness score.
         """
         for generation in range(self.num_generations):
+            scores = self.fitness_all()
+
             # Selection
-            mating_pool = self.selection()
+            mating_pool = self.selection(scores)
 
             # Crossover and mutation
             new_population = []
@@ -124,39 +143,49 @@ class GeneticAlgorithm:
                 new_population.append(child1)
                 new_population.append(child2)
 
-            # Elitism
-            for i in range(self.elitism):
-                new_population[i] = self.population[i]
+            # Elitism - carry over the best individuals of the previous generation,
+            # `fitness_all` scores are never NaN, so these are the actual top scores
+            if self.elitism:
+                elite_idx = np.argpartition(-scores, self.elitism - 1)[: self.elitism]
+                new_population[: self.elitism] = [self.population[i] for i in elite_idx]
 
             self.population = new_population
 
         # Get the best individual and its fitness score
-        best_individual = max(self.population, key=self.fitness)
-        best_fitness = self.fitness(best_individual)
+        scores = self.fitness_all()
+        idx = int(np.argmax(scores))
+        return self.population[idx], float(scores[idx])
+
+
+def main():
+    import swmmio as sw
 
-        return best_individual, best_fitness
+    from stormwater_analysis.data.feature_engineering import perform_conduits_feature_engineering
+    from stormwater_analysis.inp_manage.test_inp import TEST_FILE
 
+    conduits_data = perform_conduits_feature_engineering(sw.Model(TEST_FILE, include_rpt=True))
+    cd = conduits_data.conduits.copy()
+    population_size = 100
+    mutation_rate = 0.1
+    num_generations = 100
+    elitism = 1
 
-cd = conduits_data.conduits.copy()
-population_size = 100
-mutation_rate = 0.1
-num_generations = 100
-elitism = 1
+    ga = GeneticAlgorithm(
+        conduits_data=cd,
+        population_size=population_size,
+        mutation_rate=mutation_rate,
+        num_generations=num_generations,
+        elitism=elitism,
+    )
 
-ga = GeneticAlgorithm(
-    conduits_data=cd,
-    population_size=population_size,
-    mutation_rate=mutation_rate,
-    num_generations=num_generations,
-    elitism=elitism,
-)
+    best_individual, _ = ga.run()
+    cd["SlopePerMile"] += np.array(best_individual) * cd["SlopePerMile"]
 
-best_individual, best_fitness = ga.run()
-cd["SlopePerMile"] += np.array(best_individual) * cd["SlopePerMile"]
+    print("\n")
+    print(conduits_data.conduits)
+    print(cd)
+    # print(best_individual)
 
 
-print("\n")
-print(conduits_data.conduits)
-print(cd)
-# print(best_individual)
-# print(best_fitness)
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,8 @@
 import numpy as np
 import pandas as pd
 import pytest
-import swmmio as sw
 
 from stormwater_analysis.data.data import ConduitsData
-from stormwater_analysis.inp_manage.test_inp import TEST_FILE
 from stormwater_analysis.pipes.valid_round import validate_filling
 
 desired_width = 500
@@ -13,35 +11,44 @@ np.set_printoptions(linewidth=desired_width)
 pd.set_option("display.max_columns", 30)
 
 
-@pytest.fixture(scope="module")
-def model():
+@pytest.fixture(scope="class")
+def conduits_data(model):
     """
-    A pytest fixture that creates and provides a SWMM Model object using the TEST_FILE.
+    A pytest fixture that creates and provides a ConduitsData object using the provided SWMM Model object.
+
+    The fixture has a class scope, meaning it will be executed only once per class,
+    and the same ConduitsData object will be used across all tests within the class.
 
-    The fixture has a module scope, meaning it will be executed only once per module,
-    and the same SWMM Model object will be used across all tests within the module.
+    Args:
+        model (sw.Model): The SWMM Model object created by the model fixture.
 
     Yields:
-        sw.Model: The SWMM Model object created from the TEST_FILE.
+        ConduitsData: The ConduitsData object created using the provided SWMM Model object.
     """
-    yield sw.Model(TEST_FILE, include_rpt=True)
+    yield ConduitsData(model)
 
 
 @pytest.fixture(scope="class")
-def conduits_data(model):
+def prepared_conduits_data(model):
     """
-    A pytest fixture that creates and provides a ConduitsData object using the provided SWMM Model object.
+    A pytest fixture that provides a ConduitsData object with the common derived columns already calculated.
 
-    The fixture has a class scope, meaning it will be executed only once per class,
-    and the same ConduitsData object will be used across all tests within the class.
+    The fixture has a class scope and builds its own ConduitsData object, so tests which only read the derived
+    columns share one computation and are not affected by tests mutating the `conduits_data` fixture.
 
     Args:
         model (sw.Model): The SWMM Model object created by the model fixture.
 
     Yields:
-        ConduitsData: The ConduitsData object created using the provided SWMM Model object.
+        ConduitsData: The ConduitsData object with filling, max depth, velocity validity and slope per mile columns.
     """
-    yield ConduitsData(model)
+    conduits_data = ConduitsData(model)
+    conduits_data.drop_unused()
+    conduits_data.calculate_conduit_filling()
+    conduits_data.max_depth()
+    conduits_data.velocity_is_valid()
+    conduits_data.slope_per_mile()
+    yield conduits_data
 
 
 class TestConduitsData:
@@ -59,13 +66,13 @@ class TestConduitsData:
 
     def test_drop_unused(self, conduits_data):
         """
-        Test the 'drop_unused' method of the ConduitsData class to ensure that it correctly removes
-        the specified columns from the 'conduits' DataFrame.
+        Test that the unused columns are not loaded into the 'conduits' DataFrame and that the
+        'drop_unused' method of the ConduitsData class can still be called safely.
         """
-        assert "coords" in conduits_data.conduits.columns
-        assert "Geom2" in conduits_data.conduits.columns
-        assert "Geom3" in conduits_data.conduits.columns
-        assert "Geom4" in conduits_data.conduits.columns
+        assert "coords" not in conduits_data.conduits.columns
+        assert "Geom2" not in conduits_data.conduits.columns
+        assert "Geom3" not in conduits_data.conduits.columns
+        assert "Geom4" not in conduits_data.conduits.columns
 
         conduits_data.drop_unused()
 
@@ -81,17 +88,16 @@ class TestConduitsData:
         """
         conduits_data.calculate_conduit_filling()
         assert "Filling" in conduits_data.conduits.columns
-        assert all(conduits_data.conduits["Filling"] >= 0)
+        assert (conduits_data.conduits["Filling"].to_numpy() >= 0).all()
 
-    def test_filling_is_valid(self, conduits_data):
+    def test_filling_is_valid(self, prepared_conduits_data):
         """
         Test the 'filling_is_valid' method of the ConduitsData class to ensure that it correctly
         validates the conduit filling and adds the 'ValMaxFill' column to the 'conduits' DataFrame.
         """
-        conduits_data.calculate_conduit_filling()
-        conduits_data.filling_is_valid()
-        assert "ValMaxFill" in conduits_data.conduits.columns
-        assert all(conduits_data.conduits["ValMaxFill"].isin([0, 1]))
+        prepared_conduits_data.filling_is_valid()
+        assert "ValMaxFill" in prepared_conduits_data.conduits.columns
+        assert prepared_conduits_data.conduits["ValMaxFill"].isin([0, 1]).all()
 
     def test_validate_filling(self):
         """
@@ -112,16 +118,15 @@ class TestConduitsData:
         conduits_data.velocity_is_valid()
         assert "ValMaxV" in conduits_data.conduits.columns
 
-    def test_velocity_is_valid(self, conduits_data):
+    def test_velocity_is_valid(self, prepared_conduits_data):
         """
         Test the 'velocity_is_valid' method of the ConduitsData class to ensure that it correctly
         validates the conduit velocities and updates the 'ValMaxV' and 'ValMinV' columns in the
         'conduits' DataFrame.
         """
-        conduits_data.velocity_is_valid()
         expected_values = [1, 1]
-        assert list(conduits_data.conduits["ValMaxV"])[:2] == expected_values
-        assert list(conduits_data.conduits["ValMinV"])[:2] == expected_values
+        assert prepared_conduits_data.conduits["ValMaxV"].iloc[:2].tolist() == expected_values
+        assert prepared_conduits_data.conduits["ValMinV"].iloc[:2].tolist() == expected_values
 
     def test_slope_per_mile_column_added(self, conduits_data):
         """
@@ -131,71 +136,64 @@ class TestConduitsData:
         conduits_data.slope_per_mile()
         assert "SlopePerMile" in conduits_data.conduits.columns
 
-    def test_slope_per_mile_calculation(self, conduits_data):
+    def test_slope_per_mile_calculation(self, prepared_conduits_data):
         """
         Test if the calculated values in the 'SlopePerMile' column are correct after
         calling the slope_per_mile() method.
         """
-        conduits_data.slope_per_mile()
         expected_values = [1.80, 6.40]  # SlopeFtPerFt * 1000
-        assert list(conduits_data.conduits["SlopePerMile"])[:2] == pytest.approx(expected_values, abs=1e-9)
+        np.testing.assert_allclose(
+            prepared_conduits_data.conduits["SlopePerMile"].iloc[:2].to_numpy(), expected_values, rtol=0, atol=1e-9
+        )
 
-    def test_slopes_is_valid_columns_added(self, conduits_data):
+    def test_slopes_is_valid_columns_added(self, prepared_conduits_data):
         """
         Test if the 'ValMaxSlope' and 'ValMinSlope' columns are added to the conduits
         dataframe after calling slopes_is_valid() method.
         """
-        conduits_data.calculate_conduit_filling()
-        conduits_data.slopes_is_valid()
-        assert "ValMaxSlope" in conduits_data.conduits.columns
-        assert "ValMinSlope" in conduits_data.conduits.columns
+        prepared_conduits_data.slopes_is_valid()
+        assert "ValMaxSlope" in prepared_conduits_data.conduits.columns
+        assert "ValMinSlope" in prepared_conduits_data.conduits.columns
 
-    def test_slopes_is_valid_max_slope(self, conduits_data):
+    def test_slopes_is_valid_max_slope(self, prepared_conduits_data):
         """
         Test if the maximum slope validation is correct after
         calling the slopes_is_valid() method.
         """
-        conduits_data.calculate_conduit_filling()
-        conduits_data.slopes_is_valid()
+        prepared_conduits_data.slopes_is_valid()
         expected_values = [
             1,
             1,
         ]  # Assuming both conduits have valid maximum slopes
-        assert list(conduits_data.conduits["ValMaxSlope"])[:2] == expected_values
+        assert prepared_conduits_data.conduits["ValMaxSlope"].iloc[:2].tolist() == expected_values
 
-    def test_slopes_is_valid_min_slope(self, conduits_data):
+    def test_slopes_is_valid_min_slope(self, prepared_conduits_data):
         """
         Test if the minimum slope validation is correct after calling the slopes_is_valid() method.
         """
-        conduits_data.calculate_conduit_filling()
-        conduits_data.slopes_is_valid()
+        prepared_conduits_data.slopes_is_valid()
         expected_values = [
             1,
             1,
         ]  # Assuming both conduits have valid minimum slopes
-        assert list(conduits_data.conduits["ValMinSlope"])[:2] == expected_values
+        assert prepared_conduits_data.conduits["ValMinSlope"].iloc[:2].tolist() == expected_values
 
-    def test_max_depth_columns_added(self, conduits_data):
+    def test_max_depth_columns_added(self, prepared_conduits_data):
         """
         Test if the 'InletMaxDepth' and 'OutletMaxDepth' columns are added to the conduits DataFrame after
         calling the `max_depth()` method.
         """
-        conduits_data.max_depth()
-        assert "InletMaxDepth" in conduits_data.conduits.columns
-        assert "OutletMaxDepth" in conduits_data.conduits.columns
+        assert "InletMaxDepth" in prepared_conduits_data.conduits.columns
+        assert "OutletMaxDepth" in prepared_conduits_data.conduits.columns
 
-    def test_max_depth_inlet_values_match(self, conduits_data, model):
+    def test_max_depth_inlet_values_match(self, prepared_conduits_data, model):
         """
         Test if the 'InletMaxDepth' values in the conduits DataFrame match the corresponding 'MaxDepth' values
         in the nodes DataFrame, using the 'InletNode' as a reference.
         """
-        conduits_data.max_depth()
         nodes_data = model.nodes.dataframe
-        for _, conduit in conduits_data.conduits.iterrows():
-            inlet_node = conduit["InletNode"]
-            node_max_depth = nodes_data.loc[inlet_node, "MaxDepth"]
-            conduit_inlet_max_depth = conduit["InletMaxDepth"]
-            assert conduit_inlet_max_depth == node_max_depth
+        merged = prepared_conduits_data.conduits[["InletNode", "InletMaxDepth"]].join(nodes_data["MaxDepth"], on="InletNode")
+        assert (merged["InletMaxDepth"].to_numpy() == merged["MaxDepth"].to_numpy()).all()
 
     def test_max_depth_outlet_values_match(self, conduits_data, model):
         """
@@ -205,12 +203,9 @@ class TestConduitsData:
         conduits_data.max_depth()
         conduits_data.calculate_max_depth()
         nodes_data = model.nodes.dataframe
-        for _, conduit in conduits_data.conduits.iterrows():
-            outlet_node = conduit["OutletNode"]
-            node_max_depth = nodes_data.loc[outlet_node, "MaxDepth"]
-            conduit_outlet_max_depth = conduit["OutletMaxDepth"]
-            if not pd.isna(conduit_outlet_max_depth) and not pd.isna(node_max_depth):
-                assert conduit_outlet_max_depth == node_max_depth
+        merged = conduits_data.conduits[["OutletNode", "OutletMaxDepth"]].join(nodes_data["MaxDepth"], on="OutletNode")
+        merged = merged.dropna(subset=["OutletMaxDepth", "MaxDepth"])
+        assert (merged["OutletMaxDepth"].to_numpy() == merged["MaxDepth"].to_numpy()).all()
 
     def test_set_frost_zone_valid_categories(self, conduits_data):
         """
@@ -253,18 +248,15 @@ class TestConduitsData:
         calculates the maximum depth of each conduit's outlet, based on its inlet depth, length, and slope.
         """
         conduits_data.max_depth()
-        conduits_data.conduits.at[0, "InletMaxDepth"] = 10
-        conduits_data.conduits.at[0, "Length"] = 100
-        conduits_data.conduits.at[0, "SlopeFtPerFt"] = 0.01
-        conduits_data.conduits.at[0, "OutletMaxDepth"] = 5
-
-        conduits_data.conduits.at[1, "InletMaxDepth"] = 20
-        conduits_data.conduits.at[1, "Length"] = 200
-        conduits_data.conduits.at[1, "SlopeFtPerFt"] = 0.02
-        conduits_data.conduits.at[1, "OutletMaxDepth"] = 10
+        test_rows = pd.DataFrame(
+            np.array([[10, 100, 0.01, 5], [20, 200, 0.02, 10]], dtype=float),
+            index=[0, 1],
+            columns=["InletMaxDepth", "Length", "SlopeFtPerFt", "OutletMaxDepth"],
+        )
+        conduits_data.conduits = pd.concat([conduits_data.conduits, test_rows])
         conduits_data.calculate_max_depth()
-        assert conduits_data.conduits["OutletMaxDepth"].loc[0] == 5
-        assert conduits_data.conduits["OutletMaxDepth"].loc[1] == 10
+        assert conduits_data.conduits["OutletMaxDepth"].at[0] == 5
+        assert conduits_data.conduits["OutletMaxDepth"].at[1] == 10
         conduits_data.conduits = conduits_data.conduits.drop(index=[0, 1])
 
     def test_calculate_maximum_depth(self, conduits_data):
@@ -274,119 +266,76 @@ class TestConduitsData:
         """
         conduits_data.max_depth()
         # Set up some test data
-        test_data = [
-            {
-                "InletMaxDepth": 10,
-                "Length": 100,
-                "SlopeFtPerFt": 0.01,
-                "OutletMaxDepth": np.nan,
-            },
-            {
-                "InletMaxDepth": 20,
-                "Length": 200,
-                "SlopeFtPerFt": 0.02,
-                "OutletMaxDepth": np.nan,
-            },
+        conduits_data.conduits = pd.DataFrame(
             {
-                "InletMaxDepth": 30,
-                "Length": 300,
-                "SlopeFtPerFt": 0.03,
-                "OutletMaxDepth": np.nan,
-            },
-        ]
-        conduits_data.conduits = pd.DataFrame(test_data)
+                "InletMaxDepth": np.array([10, 20, 30], dtype=np.float64),
+                "Length": np.array([100, 200, 300], dtype=np.float64),
+                "SlopeFtPerFt": np.array([0.01, 0.02, 0.03], dtype=np.float64),
+                "OutletMaxDepth": np.full(3, np.nan),
+            }
+        )
         conduits_data.calculate_max_depth()
 
-        assert all(~pd.isna(conduits_data.conduits["OutletMaxDepth"]))
-        assert conduits_data.conduits.loc[0, "OutletMaxDepth"] == pytest.approx(9, abs=1e-9)
-        assert conduits_data.conduits.loc[1, "OutletMaxDepth"] == pytest.approx(16, abs=1e-9)
-        assert conduits_data.conduits.loc[2, "OutletMaxDepth"] == pytest.approx(21, abs=1e-9)
+        assert conduits_data.conduits["OutletMaxDepth"].notna().all()
+        assert conduits_data.conduits["OutletMaxDepth"].iat[0] == pytest.approx(9, abs=1e-9)
+        assert conduits_data.conduits["OutletMaxDepth"].iat[1] == pytest.approx(16, abs=1e-9)
+        assert conduits_data.conduits["OutletMaxDepth"].iat[2] == pytest.approx(21, abs=1e-9)
 
     def test_ground_elevation(self, conduits_data):
         """
         Test the 'ground_elevation' method of the ConduitsData class to ensure that it correctly
         calculates the amount of ground cover over each conduit's inlet and outlet.
         """
-        print("\n")
-        print(f"conduits_data: {conduits_data.conduits()}")
         conduits_data.max_depth()
-        test_data = [
+        conduits_data.conduits = pd.DataFrame(
             {
-                "InletNodeInvert": 10,
-                "InletMaxDepth": 2,
-                "InletGroundElevation": 2,
-                "OutletNodeInvert": 40,
-                "OutletMaxDepth": 8,
-                "OutletGroundElevation": 2,
-            },
-            {
-                "InletNodeInvert": 20,
-                "InletMaxDepth": 4,
-                "InletGroundElevation": 2,
-                "OutletNodeInvert": 50,
-                "OutletMaxDepth": 10,
-                "OutletGroundElevation": 2,
-            },
-            {
-                "InletNodeInvert": 30,
-                "InletMaxDepth": 6,
-                "InletGroundElevation": 2,
-                "OutletNodeInvert": 60,
-                "OutletMaxDepth": 12,
-                "OutletGroundElevation": 2,
-            },
-        ]
-        conduits_data.conduits = pd.DataFrame(test_data)
+                "InletNodeInvert": np.array([10, 20, 30], dtype=np.float64),
+                "InletMaxDepth": np.array([2, 4, 6], dtype=np.float64),
+                "InletGroundElevation": np.full(3, 2, dtype=np.float64),
+                "OutletNodeInvert": np.array([40, 50, 60], dtype=np.float64),
+                "OutletMaxDepth": np.array([8, 10, 12], dtype=np.float64),
+                "OutletGroundElevation": np.full(3, 2, dtype=np.float64),
+            }
+        )
 
         # Calculate the inlet ground cover
         conduits_data.ground_elevation()
-        print("\n")
-        print(conduits_data.conduits)
         # Check the results
-        assert all(~pd.isna(conduits_data.conduits["InletGroundElevation"]))
-        assert conduits_data.conduits.loc[0, "InletGroundElevation"] == pytest.approx(8, abs=1e-9)
-        assert conduits_data.conduits.loc[1, "InletGroundElevation"] == pytest.approx(16, abs=1e-9)
-        assert conduits_data.conduits.loc[2, "InletGroundElevation"] == pytest.approx(24, abs=1e-9)
+        assert conduits_data.conduits["InletGroundElevation"].notna().all()
+        assert conduits_data.conduits["InletGroundElevation"].iat[0] == pytest.approx(8, abs=1e-9)
+        assert conduits_data.conduits["InletGroundElevation"].iat[1] == pytest.approx(16, abs=1e-9)
+        assert conduits_data.conduits["InletGroundElevation"].iat[2] == pytest.approx(24, abs=1e-9)
 
         # Check the results
-        assert all(~pd.isna(conduits_data.conduits["OutletGroundElevation"]))
-        assert conduits_data.conduits.loc[0, "OutletGroundElevation"] == pytest.approx(32, abs=1e-9)
-        assert conduits_data.conduits.loc[1, "OutletGroundElevation"] == pytest.approx(40, abs=1e-9)
-        assert conduits_data.conduits.loc[2, "OutletGroundElevation"] == pytest.approx(48, abs=1e-9)
+        assert conduits_data.conduits["OutletGroundElevation"].notna().all()
+        assert conduits_data.conduits["OutletGroundElevation"].iat[0] == pytest.approx(32, abs=1e-9)
+        assert conduits_data.conduits["OutletGroundElevation"].iat[1] == pytest.approx(40, abs=1e-9)
+        assert conduits_data.conduits["OutletGroundElevation"].iat[2] == pytest.approx(48, abs=1e-9)
 
     def test_depth_is_valid(self, conduits_data):
         """
         Test the 'depth_is_valid' method of the ConduitsData class to ensure that it correctly
         identifies which conduits have valid depths.
         """
-        print("\n")
-        print(f"conduits_data: {conduits_data.conduits}")
         conduits_data.max_depth()
-        print("\n")
-        print(f"conduits_data: {conduits_data.conduits}")
         conduits_data.ground_elevation()
-        conduits_data.conduits.at[0, "InletNodeInvert"] = 10
-        conduits_data.conduits.at[0, "OutletNodeInvert"] = 7
-        conduits_data.conduits.at[0, "ValDepth"] = np.nan
-        conduits_data.conduits.at[0, "InletGroundElevation"] = 6
-        conduits_data.conduits.at[0, "OutletGroundElevation"] = 0
-
-        conduits_data.conduits.at[1, "InletNodeInvert"] = 10
-        conduits_data.conduits.at[1, "OutletNodeInvert"] = 5
-        conduits_data.conduits.at[1, "ValDepth"] = np.nan
-        conduits_data.conduits.at[1, "InletGroundElevation"] = 5
-        conduits_data.conduits.at[1, "OutletGroundElevation"] = 5
-
-        conduits_data.conduits.at[2, "InletNodeInvert"] = 10
-        conduits_data.conduits.at[2, "OutletNodeInvert"] = 20
-        conduits_data.conduits.at[2, "ValDepth"] = np.nan
-        conduits_data.conduits.at[2, "InletGroundElevation"] = 0
-        conduits_data.conduits.at[2, "OutletGroundElevation"] = 0
+        test_rows = pd.DataFrame(
+            np.array(
+                [
+                    [10, 7, np.nan, 6, 0],
+                    [10, 5, np.nan, 5, 5],
+                    [10, 20, np.nan, 0, 0],
+                ]
+            ),
+            index=[0, 1, 2],
+            columns=["InletNodeInvert", "OutletNodeInvert", "ValDepth", "InletGroundElevation", "OutletGroundElevation"],
+        )
+        conduits_data.conduits = pd.concat([conduits_data.conduits, test_rows])
 
         conduits_data.depth_is_valid()
-        assert conduits_data.conduits["ValDepth"].loc[0] == 1
-        assert conduits_data.conduits["ValDepth"].loc[1] == 1
-        assert conduits_data.conduits["ValDepth"].loc[2] == 0
+        assert conduits_data.conduits["ValDepth"].at[0] == 1
+        assert conduits_data.conduits["ValDepth"].at[1] == 1
+        assert conduits_data.conduits["ValDepth"].at[2] == 0
 
     def test_coverage_is_valid(self, conduits_data):
         """
@@ -394,34 +343,41 @@ class TestConduitsData:
         checks if the ground cover over each conduit's inlet and outlet is valid.
         """
         # Set up some test data
-        test_data = [
-            {
-                "InletNodeInvert": 10,
-                "OutletNodeInvert": 20,
-                "InletGroundElevation": 5,
-                "OutletGroundElevation": 15,
-            },
+        conduits_data.conduits = pd.DataFrame(
             {
-                "InletNodeInvert": 5,
-                "OutletNodeInvert": 2,
-                "InletGroundElevation": 4,
-                "OutletGroundElevation": 1,
-            },
-            {
-                "InletNodeInvert": 30,
-                "OutletNodeInvert": 40,
-                "InletGroundElevation": 15,
-                "OutletGroundElevation": 25,
-            },
-        ]
-        conduits_data.conduits = pd.DataFrame(test_data)
+                "InletNodeInvert": np.array([10, 5, 30], dtype=np.float64),
+                "OutletNodeInvert": np.array([20, 2, 40], dtype=np.float64),
+                "InletGroundElevation": np.array([5, 4, 15], dtype=np.float64),
+                "OutletGroundElevation": np.array([15, 1, 25], dtype=np.float64),
+            }
+        )
         conduits_data.frost_zone = 1.0
 
         conduits_data.coverage_is_valid()
 
-        assert all(conduits_data.conduits["ValCoverage"] == 1)
+        assert (conduits_data.conduits["ValCoverage"].to_numpy() == 1).all()
         conduits_data.conduits.at[1, "InletGroundElevation"] = 15
         conduits_data.coverage_is_valid()
-        assert conduits_data.conduits.loc[0, "ValCoverage"] == 1
-        assert conduits_data.conduits.loc[1, "ValCoverage"] == 0
-        assert conduits_data.conduits.loc[2, "ValCoverage"] == 1
+        assert conduits_data.conduits["ValCoverage"].iat[0] == 1
+        assert conduits_data.conduits["ValCoverage"].iat[1] == 0
+        assert conduits_data.conduits["ValCoverage"].iat[2] == 1
+
+    def test_compute_depth_block(self, model):
+        """
+        Test the 'compute_depth_block' method of the ConduitsData class to ensure that it produces
+        the same columns as calling the individual depth and cover methods in sequence.
+        """
+        expected = ConduitsData(model)
+        expected.set_frost_zone("II")
+        expected.max_depth()
+        expected.calculate_max_depth()
+        expected.ground_elevation()
+        expected.ground_cover()
+        expected.depth_is_valid()
+        expected.coverage_is_valid()
+
+        fused = ConduitsData(model)
+        fused.set_frost_zone("II")
+        fused.compute_depth_block()
+
+        pd.testing.assert_frame_equal(fused.conduits, expected.conduits)
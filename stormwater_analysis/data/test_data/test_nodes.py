@@ -0,0 +1,21 @@
+import pandas as pd
+
+from stormwater_analysis.data.data import NodesData
+
+
+class TestNodesData:
+    def test_drop_unused(self, model):
+        """
+        Test that the unused columns are not loaded into the 'nodes' DataFrame and that the
+        'drop_unused' method of the NodesData class drops them from a full swmmio DataFrame.
+        """
+        nodes_data = NodesData(model)
+        assert list(nodes_data.nodes.columns) == ["InvertElev", "MaxDepth"]
+
+        nodes_data.drop_unused()
+        assert list(nodes_data.nodes.columns) == ["InvertElev", "MaxDepth"]
+
+        nodes_data.nodes = model.nodes.dataframe.copy()
+        nodes_data.drop_unused()
+        assert list(nodes_data.nodes.columns) == ["InvertElev", "MaxDepth"]
+        pd.testing.assert_frame_equal(nodes_data.nodes, NodesData(model).nodes)
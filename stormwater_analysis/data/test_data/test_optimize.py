@@ -0,0 +1,66 @@
+from random import seed
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stormwater_analysis.data.optimize import GeneticAlgorithm
+
+_POPULATION = (
+    [0.1, 0.9, 0.3],
+    [0.8, 0.2, 0.5],
+    [0.4, 0.4, 0.4],
+    [0.9, 0.7, 0.1],
+)
+
+
+@pytest.fixture
+def ga():
+    """
+    A genetic algorithm over three conduits, with a fixed population of four individuals.
+    """
+    conduits = pd.DataFrame({"SlopePerMile": [2.0, -1.0, 3.0]}, index=["C1", "C2", "C3"])
+    algorithm = GeneticAlgorithm(conduits, population_size=4, mutation_rate=0.0, num_generations=0, elitism=0)
+    algorithm.population = [list(individual) for individual in _POPULATION]
+    return algorithm
+
+
+class TestFitness:
+    def test_fitness_all_matches_fitness(self, ga):
+        """
+        Test that the single-pass fitness gives the fitness of every individual.
+        """
+        expected = [ga.fitness(individual) for individual in ga.population]
+        np.testing.assert_allclose(ga.fitness_all(), expected)
+
+    def test_fitness_all_skips_nan(self, ga):
+        """
+        Test that NaN slopes and genes count as 0, like the pandas sum in `fitness`, so no score is NaN.
+        """
+        ga.conduits_data.loc["C2", "SlopePerMile"] = np.nan
+        ga.population[0][0] = np.nan
+        scores = ga.fitness_all()
+        assert not np.isnan(scores).any()
+        np.testing.assert_allclose(scores, [ga.fitness(individual) for individual in ga.population])
+
+    def test_run_returns_best_individual(self, ga):
+        """
+        Test that `run` returns the individual with the highest fitness, and its fitness.
+        """
+        ga.conduits_data.loc["C2", "SlopePerMile"] = np.nan
+        best_individual, best_fitness = ga.run()
+        assert best_individual == [0.8, 0.2, 0.5]
+        assert best_fitness == pytest.approx(3.1)
+
+
+class TestElitism:
+    def test_top_individuals_survive(self, ga):
+        """
+        Test that the `elitism` fittest individuals are carried over to the next generation.
+        """
+        seed(0)
+        ga.elitism = 2
+        ga.num_generations = 1
+        ga.run()
+        # Fitness of the fixed population: 0.2, 2.9, 1.6 and 1.4.
+        assert sorted(ga.population[:2]) == sorted([list(_POPULATION[1]), list(_POPULATION[2])])
@@ -0,0 +1,18 @@
+import pandas as pd
+
+from stormwater_analysis.data.data import SubcatchmentsData
+
+
+class TestSubcatchmentsData:
+    def test_drop_unused(self, model):
+        """
+        Test that the unused columns are not loaded into the 'subcatchments' DataFrame and that the
+        'drop_unused' method of the SubcatchmentsData class drops them from a full swmmio DataFrame.
+        """
+        subcatchments_data = SubcatchmentsData(model)
+        assert "coords" not in subcatchments_data.subcatchments.columns
+        assert "Raingage" not in subcatchments_data.subcatchments.columns
+
+        subcatchments_data.subcatchments = model.subcatchments.dataframe.copy()
+        subcatchments_data.drop_unused()
+        pd.testing.assert_frame_equal(subcatchments_data.subcatchments, SubcatchmentsData(model).subcatchments)
@@ -1,11 +1,30 @@
-from typing import Dict, List
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import swmmio
-from swmmio.utils.functions import trace_from_node
 
 from stormwater_analysis.data.data import ConduitsData, NodesData, SubcatchmentsData
-from stormwater_analysis.pipes.round import min_slope
+from stormwater_analysis.pipes.round import min_slope_vec
+from stormwater_analysis.utils.network import build_downstream_index, build_upstream_adjacency, trace_downstream, trace_outfalls
+
+
+def _ordered_digest(obj: Union[pd.DataFrame, pd.Series]) -> int:
+    """
+    Returns a 64-bit hash of the rows of `obj` which, unlike a sum of the row hashes, depends on their order.
+    """
+    row_hashes = pd.util.hash_pandas_object(obj).to_numpy()
+    return int.from_bytes(hashlib.blake2b(row_hashes.tobytes(), digest_size=8).digest(), "big")
+
+
+def _copy_traces(traces: Dict[str, Dict[str, List[str]]]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Returns a copy of the traces, so that callers cannot modify the cached ones.
+    """
+    return {outfall: {key: list(value) for key, value in trace.items()} for outfall, trace in traces.items()}
 
 
 class SwmmModel:
@@ -17,6 +36,7 @@ class SwmmModel:
         conduits_data (ConduitsData): The processed conduits data after feature engineering.
         nodes_data (NodesData): The processed nodes data after feature engineering.
         subcatchments_data (SubcatchmentsData): The processed subcatchments data after feature engineering.
+        cache_dir (Optional[Path]): The directory in which traces are stored between runs, or None.
     """
 
     def __init__(
@@ -25,6 +45,7 @@ class SwmmModel:
         conduits_data: ConduitsData,
         nodes_data: NodesData,
         subcatchments_data: SubcatchmentsData,
+        cache_dir: Optional[Union[str, Path]] = None,
     ) -> None:
         """
         Initializes a SwmmModel object with the given SWMM model and processed data.
@@ -34,24 +55,74 @@ class SwmmModel:
             conduits_data (ConduitsData): The processed conduits data after feature engineering.
             nodes_data (NodesData): The processed nodes data after feature engineering.
             subcatchments_data (SubcatchmentsData): The processed subcatchments data after feature engineering.
+            cache_dir (Optional[Union[str, Path]]): The directory in which traces are stored between runs.
+                Defaults to None, traces are then cached in memory only.
         """
         self.model = model
         self.conduits_data = conduits_data
         self.nodes_data = nodes_data
         self.subcatchments_data = subcatchments_data
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._traces_cache = None
+        self._traces_sig = None
+
+    def _network_signature(self) -> int:
+        """
+        Returns a hash of the conduits network topology (conduit names and their inlet/outlet nodes).
+
+        The rows are hashed in order, since traces follow the conduits in dataframe order.
+        """
+        return _ordered_digest(self.conduits_data.conduits[["InletNode", "OutletNode"]])
+
+    def invalidate_traces(self) -> None:
+        """
+        Drops the cached traces, so that the next `all_traces` call traces the network again.
+        """
+        self._traces_cache = None
+        self._traces_sig = None
 
     def all_traces(self) -> Dict[str, List[str]]:
         """
         Finds all traces in the SWMM model.
 
         A trace is a list of conduit IDs that connect a specific outfall to the rest of the network.
+        The traces are cached and reused for as long as the conduits network topology and order do not change,
+        every call returns a copy of them.
+        If `cache_dir` is set, the traces are also stored there and loaded by later runs on the same network.
 
         Returns:
             Dict[str, List[str]]: A dictionary where the keys are outfall IDs and the values are lists
             of conduit IDs representing the traces connecting the outfalls to the rest of the network.
         """
+        sig = self._network_signature()
+        if self._traces_cache is not None and self._traces_sig == sig:
+            return _copy_traces(self._traces_cache)
+
         outfalls = self.model.inp.outfalls.index
-        return {outfall: trace_from_node(self.conduits_data.conduits, outfall) for outfall in outfalls}
+        cache_file = self._traces_cache_file(sig, outfalls)
+        if cache_file is not None and cache_file.exists():
+            traces = json.loads(cache_file.read_text())
+        else:
+            conduits = self.conduits_data.conduits
+            adjacency = build_upstream_adjacency(conduits)
+            traces = trace_outfalls(conduits, outfalls, adjacency)
+            if cache_file is not None:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(traces))
+        self._traces_cache = traces
+        self._traces_sig = sig
+        return _copy_traces(traces)
+
+    def _traces_cache_file(self, sig: int, outfalls: pd.Index) -> Optional[Path]:
+        """
+        Returns the file in `cache_dir` for the traces of the given network and outfalls, or None if `cache_dir` is not set.
+
+        Both parts of the file name depend on the order of the rows, like the traces do.
+        """
+        if self.cache_dir is None:
+            return None
+        outfalls_sig = _ordered_digest(outfalls.to_series())
+        return self.cache_dir / f"traces-{sig:016x}-{outfalls_sig:016x}.json"
 
     def overflowing_pipes(self) -> pd.DataFrame:
         """
@@ -64,14 +135,25 @@ class SwmmModel:
             pd.DataFrame: A DataFrame containing conduits
                         in which the maximum filling height has been exceeded.
         """
-        return self.conduits_data.conduits[self.conduits_data.conduits["ValMaxFill"] == 0]
+        return self.conduits_data.conduits.loc[self.overflowing_pipe_ids()]
+
+    def overflowing_pipe_ids(self) -> pd.Index:
+        """
+        Returns the IDs of rain sewers in which the maximum filling height has been exceeded.
+
+        Unlike `overflowing_pipes`, no rows of the conduits dataframe are copied.
+
+        Returns:
+            pd.Index: The IDs of conduits in which the maximum filling height has been exceeded.
+        """
+        return self.conduits_data.conduits.index[self.conduits_data.conduits["ValMaxFill"].to_numpy() == 0]
 
     def overflowing_traces(self) -> Dict[str, Dict[str, List[str]]]:
         """
         Identifies the segments of the network system (from `all_traces`) where overflowing occurs.
 
         For each trace in `all_traces`, the function identifies the sections (conduits) where
-        the maximum filling height has been exceeded (identified by `overflowing_pipes`).
+        the maximum filling height has been exceeded (identified by `overflowing_pipe_ids`).
         The output is a dictionary that contains these segments of overflowing. For each identified
         segment, the trace from the first conduit with overflowing to the last one is included.
 
@@ -90,14 +172,14 @@ class SwmmModel:
 
         Notes
         -----
-        This method requires that `self.all_traces()` and `self.overflowing_pipes()` be defined
+        This method requires that `self.all_traces()` and `self.overflowing_pipe_ids()` be defined
         and return appropriate values. Specifically, `self.all_traces()` should return a dictionary
-        of all traces and `self.overflowing_pipes()` should return a DataFrame of overflowing pipes.
+        of all traces and `self.overflowing_pipe_ids()` should return an Index of overflowing pipes.
 
         See Also
         --------
         all_traces : method to retrieve all traces in the system.
-        overflowing_pipes : method to identify pipes where the maximum filling height is exceeded.
+        overflowing_pipe_ids : method to identify pipes where the maximum filling height is exceeded.
 
         Example
         -------
@@ -107,18 +189,20 @@ class SwmmModel:
         >>> {'O4': {'nodes': ['J0', 'J1', 'J2', 'J3'], 'conduits': ['C1', 'C2', 'C3']}}
         """
         # Fetch the data
+        conduits = self.conduits_data.conduits
+        overflowing_ids = self.overflowing_pipe_ids().to_numpy()
+        if not overflowing_ids.size:
+            return {}
         all_traces = self.all_traces()
-        overflowing_conduits = self.overflowing_pipes()
 
         overflowing_traces = {}
         for outfall_id, trace_data in all_traces.items():
-            # Check for overlap between this trace's conduits and the overflowing ones
-            overlapping_conduits = [c for c in trace_data["conduits"] if c in overflowing_conduits.index.tolist()]
-
-            if overlapping_conduits:
-                # Create a sub-dict for each overlapping conduit and its position in the trace
-                overflowing_trace = {c: trace_data["conduits"].index(c) for c in overlapping_conduits}
-                overflowing_traces[outfall_id] = overflowing_trace
+            # Positions of the overflowing conduits in this trace, found in one vectorized pass
+            trace_conduits = trace_data["conduits"]
+            positions = np.flatnonzero(np.isin(np.asarray(trace_conduits), overflowing_ids, assume_unique=True))
+            if positions.size:
+                # Map each overflowing conduit of this trace to its position in the trace
+                overflowing_traces[outfall_id] = {trace_conduits[i]: int(i) for i in positions}
         # return {
         #     key:
         #     find_network_trace(
@@ -130,12 +214,13 @@ class SwmmModel:
         #     }
         #     very interesting result
         #     >>> {'O4': [('J0', 'J1', 'C1'), ('J1', 'J2', 'C2'), ('J2', 'J3', 'C3')]}
+        downstream_index = build_downstream_index(conduits)
         return {
-            key: trace_from_node(
-                conduits=self.conduits_data.conduits,
-                startnode=overflowing_conduits.loc[list(value)[-1]]["InletNode"],
-                mode="down",
-                stopnode=overflowing_conduits.loc[list(value)[0]]["OutletNode"],
+            key: trace_downstream(
+                conduits=conduits,
+                startnode=conduits.at[list(value)[-1], "InletNode"],
+                stopnode=conduits.at[list(value)[0], "OutletNode"],
+                downstream_index=downstream_index,
             )
             for key, value in overflowing_traces.items()
         }
@@ -192,14 +277,24 @@ class SwmmModel:
         pass
 
     def optimize_conduit_slope(self) -> None:
+        """
+        Sets the slope of each conduit to its minimal slope, see `min_slope`.
+
+        Only conduits with a valid, non-empty filling are changed. Conduits whose filling or diameter
+        is missing or out of bounds, and empty conduits, which have no finite minimal slope, keep their slope.
+        """
         # Currently, this function is not needed.
         # TODO: min_slope() returns a minimal slope as number/1000,  SlopeFtPerFt is a number.
         #       So we need to convert it to number/1000.
         #       SlopePerMile take number/1000, so there is no need to convert it to number/1000.
-        self.conduits_data.conduits.SlopeFtPerFt = min_slope(
-            filling=self.conduits_data.conduits.Filling,
-            diameter=self.conduits_data.conduits.Geom1,
-        )
+        conduits = self.conduits_data.conduits
+        filling = conduits["Filling"].to_numpy(dtype=np.float64)
+        diameter = conduits["Geom1"].to_numpy(dtype=np.float64)
+        # NaN fails every comparison, so conduits with missing values are left out as well.
+        valid = (0 < filling) & (filling <= diameter) & (filling <= 2.0) & (0.2 <= diameter) & (diameter <= 2.0)
+        slopes = conduits["SlopeFtPerFt"].to_numpy(dtype=np.float64, copy=True)
+        slopes[valid] = min_slope_vec(filling=filling[valid], diameter=diameter[valid])
+        conduits["SlopeFtPerFt"] = slopes
 
     def optimize_conduit_depth(self):  # type: ignore
         # Currently, this function is not needed.
@@ -212,3 +307,4 @@ class SwmmModel:
     def optimize(self):  # type: ignore
         # Currently, this function is not needed.
         pass
+
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+import pyswmm as ps
+
+
+def run_simulation_if_stale(inp_path: str) -> None:
+    """
+    Run the SWMM simulation only if the report file is missing or older than the input file.
+
+    Args:
+        inp_path (str): path to the SWMM input file
+    """
+    rpt_path = Path(inp_path).with_suffix(".rpt")
+    if rpt_path.exists() and rpt_path.stat().st_mtime >= Path(inp_path).stat().st_mtime:
+        return
+    with ps.Simulation(inp_path) as sim:
+        for _ in sim:
+            pass
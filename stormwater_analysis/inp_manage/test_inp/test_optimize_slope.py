@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from stormwater_analysis.inp_manage.inp import SwmmModel
+from stormwater_analysis.pipes.round import min_slope
+
+
+class TestOptimizeConduitSlope:
+    def test_valid_conduits_get_min_slope(self):
+        """
+        Test that conduits with a valid filling get their minimal slope and all the others keep their slope.
+        """
+        conduits = pd.DataFrame(
+            {
+                "Filling": [0.3, 0.8, np.nan, 0.0, 0.6, 0.1],
+                "Geom1": [0.5, 1.0, 1.0, 1.0, 0.5, 3.0],
+                "SlopeFtPerFt": [0.001, 0.002, 0.003, 0.004, 0.005, 0.006],
+            },
+            index=["C1", "C2", "C3", "C4", "C5", "C6"],
+        )
+        swmm_model = SwmmModel(None, SimpleNamespace(conduits=conduits), None, None)
+        swmm_model.optimize_conduit_slope()
+
+        slopes = conduits["SlopeFtPerFt"].to_numpy()
+        np.testing.assert_allclose(slopes[:2], [min_slope(0.3, 0.5), min_slope(0.8, 1.0)])
+        # Missing, empty, overfilled and oversized conduits keep their slopes.
+        np.testing.assert_array_equal(slopes[2:], [0.003, 0.004, 0.005, 0.006])
@@ -0,0 +1,47 @@
+import os
+
+from stormwater_analysis.inp_manage import simulation
+from stormwater_analysis.inp_manage.simulation import run_simulation_if_stale
+
+
+class TestRunSimulationIfStale:
+    def test_fresh_report_skips_simulation(self, monkeypatch, tmp_path):
+        """
+        Test that the simulation is not run when the report file is newer than the input file.
+        """
+        inp_path = tmp_path / "model.inp"
+        inp_path.touch()
+        (tmp_path / "model.rpt").touch()
+        os.utime(inp_path, (0, 0))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the simulation should not be run again")
+
+        monkeypatch.setattr(simulation.ps, "Simulation", fail)
+        run_simulation_if_stale(str(inp_path))
+
+    def test_stale_report_runs_simulation(self, monkeypatch, tmp_path):
+        """
+        Test that the simulation is run when the report file is missing or older than the input file.
+        """
+        inp_path = tmp_path / "model.inp"
+        inp_path.touch()
+        runs = []
+
+        class Simulation:
+            def __init__(self, path):
+                runs.append(path)
+
+            def __enter__(self):
+                return iter(())
+
+            def __exit__(self, *args):
+                return False
+
+        monkeypatch.setattr(simulation.ps, "Simulation", Simulation)
+        run_simulation_if_stale(str(inp_path))
+        rpt_path = tmp_path / "model.rpt"
+        rpt_path.touch()
+        os.utime(rpt_path, (0, 0))
+        run_simulation_if_stale(str(inp_path))
+        assert runs == [str(inp_path), str(inp_path)]
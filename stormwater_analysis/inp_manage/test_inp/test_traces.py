@@ -0,0 +1,161 @@
+from copy import deepcopy
+from types import SimpleNamespace
+
+import pytest
+from swmmio.utils.functions import trace_from_node
+
+from stormwater_analysis.inp_manage import inp
+from stormwater_analysis.inp_manage.inp import SwmmModel
+from stormwater_analysis.utils import network
+from stormwater_analysis.utils.network import (
+    build_downstream_index,
+    build_upstream_adjacency,
+    trace_downstream,
+    trace_outfalls,
+    trace_upstream,
+)
+
+
+@pytest.fixture(scope="module")
+def conduits(model):
+    """
+    A pytest fixture that provides the conduits dataframe of the model, indexed by conduit name.
+
+    Yields:
+        pd.DataFrame: The conduits dataframe.
+    """
+    yield model.conduits().set_index("Name")
+
+
+class TestTraceUpstream:
+    def test_matches_swmmio_trace(self, model, conduits):
+        """
+        Test that tracing with the precomputed adjacency gives the same traces as swmmio for every outfall.
+        """
+        adjacency = build_upstream_adjacency(conduits)
+        for outfall in model.inp.outfalls.index:
+            assert trace_upstream(conduits, outfall, adjacency) == trace_from_node(conduits, outfall)
+
+    def test_matches_swmmio_trace_with_categorical_nodes(self, model, conduits):
+        """
+        Test that node IDs stored as categoricals give the same traces.
+        """
+        categorical = conduits.astype({"InletNode": "category", "OutletNode": "category"})
+        adjacency = build_upstream_adjacency(categorical)
+        for outfall in model.inp.outfalls.index:
+            assert trace_upstream(categorical, outfall, adjacency) == trace_from_node(conduits, outfall)
+
+    def test_unknown_node(self, conduits):
+        """
+        Test that tracing from a node which is not connected to any conduit returns only that node.
+        """
+        adjacency = build_upstream_adjacency(conduits)
+        assert trace_upstream(conduits, "UNKNOWN", adjacency) == {"nodes": ["UNKNOWN"], "conduits": []}
+
+
+class TestTraceDownstream:
+    def test_matches_swmmio_trace(self, conduits):
+        """
+        Test that tracing downstream gives the same traces as swmmio from every node, without and with
+        a stop node on the way.
+        """
+        for startnode in conduits["InletNode"].unique():
+            trace = trace_from_node(conduits, startnode, mode="down")
+            assert trace_downstream(conduits, startnode) == trace
+            for stopnode in trace["nodes"][1:]:
+                expected = trace_from_node(conduits, startnode, mode="down", stopnode=stopnode)
+                assert trace_downstream(conduits, startnode, stopnode) == expected
+
+    def test_matches_swmmio_trace_with_categorical_nodes(self, conduits):
+        """
+        Test that node IDs stored as categoricals give the same traces.
+        """
+        categorical = conduits.astype({"InletNode": "category", "OutletNode": "category"})
+        for startnode in conduits["InletNode"].unique():
+            assert trace_downstream(categorical, startnode) == trace_from_node(conduits, startnode, mode="down")
+
+    def test_shared_downstream_index(self, conduits):
+        """
+        Test that traces reusing one prebuilt downstream index match the traces building their own.
+        """
+        downstream_index = build_downstream_index(conduits)
+        for startnode in conduits["InletNode"].unique():
+            expected = trace_downstream(conduits, startnode)
+            assert trace_downstream(conduits, startnode, downstream_index=downstream_index) == expected
+
+    def test_unknown_node(self, conduits):
+        """
+        Test that tracing from a node which is not connected to any conduit returns only that node.
+        """
+        assert trace_downstream(conduits, "UNKNOWN") == {"nodes": ["UNKNOWN"], "conduits": []}
+
+
+class TestTraceOutfalls:
+    def test_matches_trace_upstream(self, model, conduits):
+        """
+        Test that tracing all outfalls gives the trace of every outfall.
+        """
+        adjacency = build_upstream_adjacency(conduits)
+        outfalls = model.inp.outfalls.index
+        expected = {outfall: trace_upstream(conduits, outfall, adjacency) for outfall in outfalls}
+        assert trace_outfalls(conduits, outfalls, adjacency) == expected
+
+    def test_worker_processes(self, monkeypatch, conduits):
+        """
+        Test that tracing in worker processes gives the same traces as tracing serially.
+        """
+        monkeypatch.setattr(network, "_PARALLEL_TRACES_MIN_OUTFALLS", 0)
+        monkeypatch.setattr(network, "_PARALLEL_TRACES_MIN_CONDUITS", 0)
+        adjacency = build_upstream_adjacency(conduits)
+        startnodes = conduits["OutletNode"].unique().tolist()
+        expected = {node: trace_upstream(conduits, node, adjacency) for node in startnodes}
+        assert trace_outfalls(conduits, startnodes, adjacency, max_workers=2) == expected
+
+
+class TestAllTracesCache:
+    def test_reordered_conduits_traced_again(self, model, conduits):
+        """
+        Test that reordering the conduit rows, which changes the traces, is not served from the cache.
+        """
+        conduits_data = SimpleNamespace(conduits=conduits)
+        swmm_model = SwmmModel(model, conduits_data, None, None)
+        swmm_model.all_traces()
+        conduits_data.conduits = conduits.iloc[::-1]
+        reordered = conduits_data.conduits
+        expected = trace_outfalls(reordered, model.inp.outfalls.index, build_upstream_adjacency(reordered))
+        assert swmm_model.all_traces() == expected
+
+    def test_returned_traces_are_copies(self, model, conduits):
+        """
+        Test that modifying the returned traces does not modify the cached ones.
+        """
+        swmm_model = SwmmModel(model, SimpleNamespace(conduits=conduits), None, None)
+        traces = swmm_model.all_traces()
+        expected = deepcopy(traces)
+        for trace in traces.values():
+            trace["conduits"].clear()
+        assert swmm_model.all_traces() == expected
+
+    def test_traces_loaded_from_cache_dir(self, monkeypatch, tmp_path, model, conduits):
+        """
+        Test that traces stored in the cache directory are loaded by a new model instead of tracing again.
+        """
+        conduits_data = SimpleNamespace(conduits=conduits)
+        expected = SwmmModel(model, conduits_data, None, None, cache_dir=tmp_path).all_traces()
+        assert len(list(tmp_path.glob("traces-*.json"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the network should not be traced again")
+
+        monkeypatch.setattr(inp, "trace_outfalls", fail)
+        assert SwmmModel(model, conduits_data, None, None, cache_dir=tmp_path).all_traces() == expected
+
+    def test_reordered_conduits_not_loaded_from_cache_dir(self, tmp_path, model, conduits):
+        """
+        Test that traces stored for one conduit order are not loaded for the reordered network.
+        """
+        SwmmModel(model, SimpleNamespace(conduits=conduits), None, None, cache_dir=tmp_path).all_traces()
+        reordered = conduits.iloc[::-1]
+        traces = SwmmModel(model, SimpleNamespace(conduits=reordered), None, None, cache_dir=tmp_path).all_traces()
+        assert traces == trace_outfalls(reordered, model.inp.outfalls.index, build_upstream_adjacency(reordered))
+        assert len(list(tmp_path.glob("traces-*.json"))) == 2
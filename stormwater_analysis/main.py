@@ -1,10 +1,10 @@
 import numpy as np
 import pandas as pd
-import pyswmm as ps  # noqa
 import swmmio as sw
 
 from stormwater_analysis.data.feature_engineering import feature_engineering
 from stormwater_analysis.inp_manage.inp import SwmmModel  # noqa
+from stormwater_analysis.inp_manage.simulation import run_simulation_if_stale
 from stormwater_analysis.inp_manage.test_inp import TEST_FILE
 
 desired_width = 500
@@ -16,9 +16,7 @@ pd.set_option("display.max_columns", 30)
 def main():
     model = sw.Model(TEST_FILE, include_rpt=True)
 
-    with ps.Simulation(model.inp.path) as sim:
-        for _ in sim:
-            pass
+    run_simulation_if_stale(model.inp.path)
 
     conduits_data, nodes_data, subcatchments_data = feature_engineering(model)
 
@@ -1,6 +1,13 @@
-from stormwater_analysis.pipes.round import max_depth_value, max_slopes, max_velocity_value, min_velocity_value
+from stormwater_analysis.pipes.round import (
+    get_max_slopes,
+    max_depth_value,
+    max_slopes,
+    max_velocity_value,
+    min_velocity_value,
+)
 
 __all__ = [
+    "get_max_slopes",
     "max_slopes",
     "max_velocity_value",
     "min_velocity_value",
@@ -1,13 +1,17 @@
 import logging
 import math
-from typing import Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Tuple, Union
 
-import matplotlib.pyplot
-import matplotlib.pyplot as plt
+import numpy as np
 from numpy import cos, linspace, pi, sin
 
 from stormwater_analysis.utils.lazy_object import LazyObject
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +47,7 @@ def check_dimensions(filling: float, diameter: float) -> bool:
     return True
 
 
-def max_filling(diameter: float) -> float:
+def max_filling(diameter: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
     > Calculates the maximum filling of a rainwater
     drain with a circular cross-section.
@@ -57,11 +61,16 @@ def max_filling(diameter: float) -> float:
     Polska Akademia Nauk. Instytut Podstawowych Problemów Techniki.
 
     Args:
-        diameter (int, float): the diameter of the rainwater pipe [m].
+        diameter (int, float, np.ndarray): the diameter of the rainwater pipe [m],
+        or an array of diameters.
 
     Return:
-        maximum filling (float): he maximum pipe filling [m].
+        maximum filling (float, np.ndarray): he maximum pipe filling [m].
     """
+    if isinstance(diameter, np.ndarray):
+        if not np.all((0.2 <= diameter) & (diameter <= 2.0)):
+            raise ValueError("Invalid diameter value.")
+        return 0.827 * diameter
     if isinstance(diameter, (int, float)):
         if 0.2 <= diameter <= 2.0:
             return 0.827 * diameter
@@ -101,6 +110,32 @@ def max_depth():
     return 8
 
 
+def _wetted_section(filling: float, diameter: float) -> Tuple[float, float]:
+    """
+    Calculate the cross-sectional area and the circumference of the wetted part of a pipe.
+
+    The chord and the central angle of the water level are shared by both values,
+    so they are computed once for `calc_f`, `calc_u` and `calc_rh`.
+
+    Args:
+        filling (int, float): pipe filling height [m]
+        diameter (int, float): pipe diameter [m]
+
+    Return:
+        area, circumference (Tuple[float, float]): cross-sectional area [m2]
+        and circumference [m] of the wetted part of the pipe
+    """
+    radius = diameter / 2
+    chord = math.sqrt((radius**2 - ((filling - radius) ** 2))) * 2
+    alpha = 2 * math.asin(min(1.0, chord / (2 * radius)))
+    segment = 1 / 2 * (alpha - math.sin(alpha)) * radius**2
+    arc = alpha * radius
+    if filling > radius:
+        return pi * radius**2 - segment, 2 * pi * radius - arc
+    return segment, arc
+
+
+@lru_cache(maxsize=4096)
 def calc_f(filling: float, diameter: float) -> float:
     """
     Calculate the cross-sectional area of a pipe.
@@ -119,19 +154,10 @@ def calc_f(filling: float, diameter: float) -> float:
         area of the wetted part of the pipe [m2]
     """
     if check_dimensions(filling, diameter):
-        radius = diameter / 2
-        chord = math.sqrt((radius**2 - ((filling - radius) ** 2))) * 2
-        alpha = math.acos((radius**2 + radius**2 - chord**2) / (2 * radius**2))
-        if filling > radius:
-            return pi * radius**2 - (1 / 2 * (alpha - math.sin(alpha)) * radius**2)
-        elif filling == radius:
-            return pi * radius**2 / 2
-        elif filling == diameter:
-            return pi * radius**2
-        else:
-            return 1 / 2 * (alpha - math.sin(alpha)) * radius**2
+        return _wetted_section(filling, diameter)[0]
 
 
+@lru_cache(maxsize=4096)
 def calc_u(filling: float, diameter: float) -> float:
     """
     Calculate the circumference of a wetted part of pipe.
@@ -146,15 +172,10 @@ def calc_u(filling: float, diameter: float) -> float:
         circumference (int, float): circumference of a wetted part of pipe
     """
     if check_dimensions(filling, diameter):
-        radius = diameter / 2
-        chord = math.sqrt((radius**2 - (filling - radius) ** 2)) * 2
-        alpha = math.degrees(math.acos((radius**2 + radius**2 - chord**2) / (2 * radius**2)))
-        if filling > radius:
-            return 2 * math.pi * radius - (alpha / 360 * 2 * math.pi * radius)
-        return alpha / 360 * 2 * math.pi * radius
+        return _wetted_section(filling, diameter)[1]
 
 
-def calc_rh(filling: float, diameter: float) -> float:
+def calc_rh(filling: Union[float, np.ndarray], diameter: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Calculate the hydraulic radius Rh, i.e. the ratio of the cross-section f
     to the contact length of the sewage with the sewer wall,
@@ -163,17 +184,29 @@ def calc_rh(filling: float, diameter: float) -> float:
     Oficyna Wydawnicza Politechniki Warszawskiej, Warszawa 1998. - in polish.
 
     Args:
-        filling (int, float): pipe filling height [m]
-        diameter (int, float): pipe diameter [m]
+        filling (int, float, np.ndarray): pipe filling height [m]
+        diameter (int, float, np.ndarray): pipe diameter [m]
 
     Return:
-        Rh (int, float): hydraulic radius [m]
+        Rh (int, float, np.ndarray): hydraulic radius [m],
+        an array of radii if filling or diameter is an array, see `calc_rh_vec`.
     """
+    if isinstance(filling, np.ndarray) or isinstance(diameter, np.ndarray):
+        return calc_rh_vec(filling, diameter)
     if check_dimensions(filling, diameter):
-        try:
-            return calc_f(filling, diameter) / calc_u(filling, diameter)
-        except ZeroDivisionError:
-            return 0
+        return _calc_rh_raw(filling, diameter)
+
+
+@lru_cache(maxsize=4096)
+def _calc_rh_raw(filling: float, diameter: float) -> float:
+    """
+    Calculate the hydraulic radius like `calc_rh`, for dimensions which have already been checked.
+    """
+    area, circumference = _wetted_section(filling, diameter)
+    try:
+        return area / circumference
+    except ZeroDivisionError:
+        return 0
 
 
 def calc_velocity(
@@ -194,10 +227,12 @@ def calc_velocity(
     """
     if check_dimensions(filling, diameter):
         slope = slope / 1000
-        return 1 / 0.013 * calc_rh(filling, diameter) ** (2 / 3) * (slope**0.5)
+        return 1 / 0.013 * _calc_rh_raw(filling, diameter) ** (2 / 3) * (slope**0.5)
 
 
-def min_slope(filling: float, diameter: float, theta: float = 1.5, g: float = 9.81) -> float:
+def min_slope(
+    filling: Union[float, np.ndarray], diameter: Union[float, np.ndarray], theta: float = 1.5, g: float = 9.81
+) -> Union[float, np.ndarray]:
     """
     Get the minimal slope for sewer pipe.
     If the pipe  filling is greater than 0.3,
@@ -209,21 +244,169 @@ def min_slope(filling: float, diameter: float, theta: float = 1.5, g: float = 9.
     hydraulicznych-kanalow-sciekowych-i-deszczowych/
 
     Args:
-        filling (int, float): pipe filling height [m]
-        diameter (int, float): pipe diameter [m]
+        filling (int, float, np.ndarray): pipe filling height [m]
+        diameter (int, float, np.ndarray): pipe diameter [m]
         theta (float, optional): theta value.
         Defaults to 1.5, shear stress [Pa].
         g (float, optional): specific gravity
         of liquid (water/wastewater) [N/m3].
 
     Return:
-        slope (int, float): The minimum slope of the channel [‰]
+        slope (int, float, np.ndarray): The minimum slope of the channel [‰], inf for an empty pipe,
+        an array of slopes if filling or diameter is an array, see `min_slope_vec`.
     """
+    if isinstance(filling, np.ndarray) or isinstance(diameter, np.ndarray):
+        return min_slope_vec(filling, diameter, theta, g)
     if check_dimensions(filling, diameter):
-        return 4 * (theta / g) * ((diameter / 4) / calc_rh(filling, diameter)) * (1 / diameter)
+        return _min_slope_raw(filling, diameter, theta, g)
 
 
-def max_slope(diameter: Union[float, int]) -> Union[float, int]:
+def _min_slope_raw(filling: float, diameter: float, theta: float = 1.5, g: float = 9.81) -> float:
+    """
+    Calculate the minimal slope like `min_slope`, for dimensions which have already been checked.
+    """
+    rh = _calc_rh_raw(filling, diameter)
+    if rh == 0:
+        return math.inf
+    return 4 * (theta / g) * ((diameter / 4) / rh) * (1 / diameter)
+
+
+def check_dimensions_vec(filling: np.ndarray, diameter: np.ndarray) -> bool:
+    """
+    Check if the given filling and diameter arrays are valid, element-wise.
+
+    Args:
+        filling (np.ndarray): the heights of the filling in the pipes, in meters.
+        diameter (np.ndarray): the diameters of the pipes, in meters.
+
+    Returns:
+        bool: True if all the values are valid.
+
+    Raises:
+        ValueError: If any filling is greater than its diameter,
+        or any filling or diameter is not between 0.2 and 2.0 meters.
+    """
+    if np.any(filling > diameter):
+        raise ValueError("Filling must be less than or equal to the diameter")
+    if not np.all((0 <= filling) & (filling <= 2.0) & (0.2 <= diameter) & (diameter <= 2.0)):
+        raise ValueError(
+            """Value out of bounds. Filling must be between 0.2 and 2.0
+            meters and diameter must be between 0.2 and 2.0 meters"""
+        )
+    return True
+
+
+def _segment_angle(filling: np.ndarray, radius: np.ndarray) -> np.ndarray:
+    """
+    Calculate the central angle [rad] of the circular segment cut off by the water level.
+    """
+    chord = np.sqrt(np.maximum(radius**2 - (filling - radius) ** 2, 0)) * 2
+    return 2 * np.arcsin(np.clip(chord / (2 * radius), 0, 1))
+
+
+def _wetted_section_vec(filling: np.ndarray, diameter: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the cross-sectional areas and circumferences of the wetted parts of pipes like `_wetted_section`,
+    for arrays which have already been checked.
+    """
+    radius = diameter / 2
+    alpha = _segment_angle(filling, radius)
+    segment = 1 / 2 * (alpha - np.sin(alpha)) * radius**2
+    arc = alpha * radius
+    over_half = filling > radius
+    return np.where(over_half, pi * radius**2 - segment, segment), np.where(over_half, 2 * pi * radius - arc, arc)
+
+
+def calc_f_vec(filling: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    """
+    Calculate the cross-sectional areas of the wetted parts of pipes, see `calc_f`.
+
+    Args:
+        filling (np.ndarray): pipe filling heights [m]
+        diameter (np.ndarray): pipe diameters [m]
+
+    Return:
+        area (np.ndarray): cross-sectional areas of the wetted parts of the pipes [m2]
+    """
+    filling = np.asarray(filling, dtype=np.float64)
+    diameter = np.asarray(diameter, dtype=np.float64)
+    check_dimensions_vec(filling, diameter)
+    return _wetted_section_vec(filling, diameter)[0]
+
+
+def calc_u_vec(filling: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    """
+    Calculate the circumferences of the wetted parts of pipes, see `calc_u`.
+
+    Args:
+        filling (np.ndarray): pipe filling heights [m]
+        diameter (np.ndarray): pipe diameters [m]
+
+    Return:
+        circumference (np.ndarray): circumferences of the wetted parts of the pipes [m]
+    """
+    filling = np.asarray(filling, dtype=np.float64)
+    diameter = np.asarray(diameter, dtype=np.float64)
+    check_dimensions_vec(filling, diameter)
+    return _wetted_section_vec(filling, diameter)[1]
+
+
+def calc_rh_vec(filling: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    """
+    Calculate the hydraulic radii of pipes, see `calc_rh`.
+
+    Args:
+        filling (np.ndarray): pipe filling heights [m]
+        diameter (np.ndarray): pipe diameters [m]
+
+    Return:
+        Rh (np.ndarray): hydraulic radii [m], 0 for empty pipes
+    """
+    filling = np.asarray(filling, dtype=np.float64)
+    diameter = np.asarray(diameter, dtype=np.float64)
+    check_dimensions_vec(filling, diameter)
+    return _calc_rh_vec_raw(filling, diameter)
+
+
+def _calc_rh_vec_raw(filling: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    """
+    Calculate the hydraulic radii like `calc_rh_vec`, for arrays which have already been checked.
+    """
+    area, circumference = _wetted_section_vec(filling, diameter)
+    return np.divide(area, circumference, out=np.zeros_like(area), where=circumference != 0)
+
+
+def min_slope_vec(filling: np.ndarray, diameter: np.ndarray, theta: float = 1.5, g: float = 9.81) -> np.ndarray:
+    """
+    Get the minimal slopes for sewer pipes, see `min_slope`.
+
+    Args:
+        filling (np.ndarray): pipe filling heights [m]
+        diameter (np.ndarray): pipe diameters [m]
+        theta (float, optional): theta value.
+        Defaults to 1.5, shear stress [Pa].
+        g (float, optional): specific gravity
+        of liquid (water/wastewater) [N/m3].
+
+    Return:
+        slope (np.ndarray): The minimum slopes of the channels [‰], inf for empty pipes
+    """
+    filling = np.asarray(filling, dtype=np.float64)
+    diameter = np.asarray(diameter, dtype=np.float64)
+    check_dimensions_vec(filling, diameter)
+    return _min_slope_vec_raw(filling, diameter, theta, g)
+
+
+def _min_slope_vec_raw(filling: np.ndarray, diameter: np.ndarray, theta: float = 1.5, g: float = 9.81) -> np.ndarray:
+    """
+    Calculate the minimal slopes like `min_slope_vec`, for arrays which have already been checked.
+    """
+    rh = _calc_rh_vec_raw(filling, diameter)
+    with np.errstate(divide="ignore"):
+        return 4 * (theta / g) * ((diameter / 4) / rh) * (1 / diameter)
+
+
+def max_slope(diameter: Union[float, int, np.ndarray]) -> Union[float, int, np.ndarray]:
     """
     Calculates the maximum slope for a given pipe diameter.
 
@@ -234,18 +417,23 @@ def max_slope(diameter: Union[float, int]) -> Union[float, int]:
     pipeline.
 
     Args:
-        diameter (Union[float, int]): pipe diameter [m].
+        diameter (Union[float, int, np.ndarray]): pipe diameter [m].
 
     Returns:
-        Union[float, int]: The maximum slope that can be achieved for the pipe.
+        Union[float, int, np.ndarray]: The maximum slope that can be achieved for the pipe,
+        an array of slopes if diameter is an array, see `max_slope_vec`.
     """
+    if isinstance(diameter, np.ndarray):
+        return max_slope_vec(diameter)
     if check_dimensions(diameter, diameter):
-        start_slope = min_slope(diameter, diameter)
+        start_slope = _min_slope_raw(diameter, diameter)
         slope = start_slope
         v_max = max_velocity()
         v_clc = 0.0
+        # The pipe is full in every iteration, so the Manning term of `calc_velocity` does not change.
+        manning = 1 / 0.013 * _calc_rh_raw(diameter, diameter) ** (2 / 3)
         while round(v_clc, 2) != float(v_max):
-            v_clc = calc_velocity(diameter, diameter, slope)
+            v_clc = manning * ((slope / 1000) ** 0.5)
             if v_clc < v_max:
                 slope += start_slope
             else:
@@ -254,7 +442,41 @@ def max_slope(diameter: Union[float, int]) -> Union[float, int]:
         return slope
 
 
-def draw_pipe_section(filling: float, diameter: float, max_filling: Union[float, None] = None) -> matplotlib.pyplot:
+def max_slope_vec(diameter: np.ndarray) -> np.ndarray:
+    """
+    Calculates the maximum slopes for pipe diameters, see `max_slope`.
+
+    All pipes take the same steps as in `max_slope`, the pipes whose velocity
+    already matches the maximum velocity are left out of the following steps.
+
+    Args:
+        diameter (np.ndarray): pipe diameters [m].
+
+    Returns:
+        np.ndarray: The maximum slopes that can be achieved for the pipes.
+    """
+    diameter = np.asarray(diameter, dtype=np.float64)
+    check_dimensions_vec(diameter, diameter)
+    step = _min_slope_vec_raw(diameter, diameter)
+    slope = step.copy()
+    v_max = max_velocity()
+    v_clc = np.zeros_like(diameter)
+    manning = 1 / 0.013 * _calc_rh_vec_raw(diameter, diameter) ** (2 / 3)
+    active = np.flatnonzero(np.round(v_clc, 2) != v_max)
+    while active.size:
+        v_clc[active] = manning[active] * ((slope[active] / 1000) ** 0.5)
+        slower = active[v_clc[active] < v_max]
+        faster = active[v_clc[active] >= v_max]
+        slope[slower] += step[slower]
+        step[faster] /= 2
+        slope[faster] -= step[faster]
+        active = active[np.round(v_clc[active], 2) != v_max]
+    return slope
+
+
+def draw_pipe_section(
+    filling: float, diameter: float, max_filling: Union[float, None] = None, show: bool = True
+) -> "matplotlib.pyplot":
     """
     Plot a pipe section with a given diameter and filling height.
 
@@ -264,105 +486,105 @@ def draw_pipe_section(filling: float, diameter: float, max_filling: Union[float,
         max_filling (int, flow): The maximum filling of the pipe.
         If the pipe is filled above this level, the wetted part
         of the pipe will be drawn in red
+        show (bool): show the figure, set to False to draw several sections before showing them
     """
+    # matplotlib is slow to import and only needed for drawing.
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
     if max_filling is None:
         max_filling = diameter
 
     radius = diameter / 2
-    # draw center point  - 0, 0
-    plt.plot(0, 0, color="black", marker="o")
-    plt.gca().annotate(
-        "O (0, 0)",
-        xy=(0 + radius / 10, 0 + radius / 10),
-        xycoords="data",
-        fontsize=12,
-    )
-    plt.xlim(-radius - 0.05, radius + 0.05)
-    plt.ylim(-radius, radius + 0.07)
-    plt.gca().set_aspect("equal")
+    ax = plt.gca()
+    ax.set_xlim(-radius - 0.05, radius + 0.05)
+    ax.set_ylim(-radius, radius + 0.07)
+    ax.set_aspect("equal")
 
     # draw circle
     angels = linspace(0 * pi, 2 * pi, 100)
-    xs = radius * cos(angels)
-    ys = radius * sin(angels)
-    # add circle
-    plt.plot(xs, ys, color="brown", label=f"Pipe: DN {diameter} [m]")
-
-    # draw diameter
-    plt.plot(radius, 0, marker="o", color="blue")
-    plt.plot(-radius, 0, marker="o", color="blue")
-    plt.plot([radius, -radius], [0, 0])
-    # annotation to diameter
-    plt.gca().annotate(
-        f"Diameter={diameter}",
-        xy=(radius / 8, -radius / 5),
-        xycoords="data",
-        fontsize=12,
-    )
+    ax.plot(radius * cos(angels), radius * sin(angels), color="brown", label=f"Pipe: DN {diameter} [m]")
 
     # draw level of water
-    plt.plot(0, -radius, marker="o", color="purple")
-    plt.plot(0, filling - radius, marker="o", color="purple")
-    plt.plot(
+    ax.plot(
         [0, 0],
         [-radius, filling - radius],
         color="purple",
         label=f"Pipe filling height: {filling} [m]",
     )
-    plt.gca().annotate(
-        f"Water lvl={filling}",
-        xy=(radius / 2, filling - radius + 0.01),
-        xycoords="data",
-        fontsize=12,
-    )
 
     # Draw arc as created by water level
     chord = math.sqrt((radius**2 - ((filling - radius) ** 2))) * 2
-    alpha = math.acos((radius**2 + radius**2 - chord**2) / (2 * radius**2))
+    alpha = 2 * math.asin(min(1.0, chord / (2 * radius)))
 
     if filling > max_filling:
         color = "red"
     else:
         color = "blue"
     # Create arc
+    diff = math.radians(180) - alpha
     if filling <= radius:
-        diff = math.radians(180) - alpha
         arc_angles = linspace(diff / 2, alpha + diff / 2, 20)
     else:
-        diff = math.radians(180) - alpha
         arc_angles = linspace(-diff / 2, alpha + diff + diff / 2, 100)
     arc_xs = radius * cos(arc_angles)
     arc_ys = radius * sin(arc_angles)
-    plt.plot(arc_xs, -arc_ys, color=color, lw=3)
-    plt.plot(
+    ax.plot(
         [-arc_xs[0], -arc_xs[-1]],
         [-arc_ys[0], -arc_ys[-1]],
-        marker="o",
         color=color,
         lw=3,
         label=f"Wetted part of pipe: {calc_f(filling, diameter):.2f} [m2]",
     )
-    plt.grid(True)
-    plt.legend(loc="upper left")
-    plt.show()
-
-
-max_slopes = LazyObject(  # type: ignore
-    lambda: {
-        "0.2": max_slope(0.2),
-        "0.3": max_slope(0.3),
-        "0.4": max_slope(0.4),
-        "0.5": max_slope(0.5),
-        "0.6": max_slope(0.6),
-        "0.7": max_slope(0.7),
-        "0.8": max_slope(0.8),
-        "0.9": max_slope(0.9),
-        "1.0": max_slope(1.0),
-        "1.2": max_slope(1.2),
-        "1.5": max_slope(1.5),
-        "2.0": max_slope(2.0),
-    }
-)
+
+    # Unlabelled lines (diameter and wetted arc) and all the points are drawn as one artist each.
+    ax.add_collection(
+        LineCollection(
+            [[(radius, 0), (-radius, 0)], np.column_stack([arc_xs, -arc_ys])],
+            colors=["C0", color],
+            linewidths=[1.5, 3],
+        )
+    )
+    ax.scatter(
+        [0, radius, -radius, 0, 0, -arc_xs[0], -arc_xs[-1]],
+        [0, 0, 0, -radius, filling - radius, -arc_ys[0], -arc_ys[-1]],
+        c=["black", "blue", "blue", "purple", "purple", color, color],
+        zorder=3,
+    )
+
+    for text, xy in (
+        ("O (0, 0)", (0 + radius / 10, 0 + radius / 10)),
+        (f"Diameter={diameter}", (radius / 8, -radius / 5)),
+        (f"Water lvl={filling}", (radius / 2, filling - radius + 0.01)),
+    ):
+        ax.annotate(text, xy=xy, xycoords="data", fontsize=12)
+
+    ax.grid(True)
+    ax.legend(loc="upper left")
+    if show:
+        plt.show()
+
+
+# Standard sewer pipe diameters [m] with a precomputed maximum slope in `get_max_slopes`.
+STANDARD_DIAMETERS = (0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.2, 1.5, 2.0)
+
+
+@lru_cache(maxsize=None)
+def get_max_slopes() -> Mapping[str, float]:
+    """
+    Get the maximum slopes of the standard pipe diameters.
+
+    The slopes are calculated on the first call and the same read-only mapping is returned afterwards.
+
+    Returns:
+        Mapping[str, float]: The maximum slope [‰] keyed by the diameter as a string, e.g. "0.5".
+    """
+    slopes = max_slope_vec(np.array(STANDARD_DIAMETERS)).tolist()
+    return MappingProxyType({str(diameter): slope for diameter, slope in zip(STANDARD_DIAMETERS, slopes)})
+
+
+# Kept for backward compatibility, use `get_max_slopes` instead.
+max_slopes = LazyObject(get_max_slopes)  # type: ignore
 
 
 max_velocity_value = max_velocity()
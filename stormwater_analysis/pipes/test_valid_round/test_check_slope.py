@@ -0,0 +1,33 @@
+import pytest
+
+from stormwater_analysis.pipes.valid_round import _check_slope_ok, check_slope
+
+
+class TestCheckSlope:
+    """
+    Tests for the `check_slope` function.
+    """
+
+    @pytest.mark.parametrize(
+        ("slope", "expected"),
+        ((0.1, True), (1, True), (900, True), (0, ValueError), (-0.1, ValueError), ("0.1", TypeError), ("nan", TypeError)),
+    )
+    def test_check_slope(self, slope, expected):
+        """
+        Test the `check_slope` function returns True for positive slopes and raises otherwise.
+        """
+        if isinstance(expected, type) and issubclass(expected, Exception):
+            with pytest.raises(expected):
+                check_slope(slope)
+        else:
+            assert check_slope(slope) is expected
+
+    @pytest.mark.parametrize(
+        ("slope", "expected"),
+        ((0.1, True), (1, True), (900, True), (0, False), (-0.1, False), ("0.1", False), ("nan", False), (None, False)),
+    )
+    def test_check_slope_ok(self, slope, expected):
+        """
+        Test the `_check_slope_ok` function returns a bool instead of raising.
+        """
+        assert _check_slope_ok(slope) is expected
@@ -5,18 +5,78 @@ import pytest
 
 from stormwater_analysis.pipes.round import (
     calc_f,
+    calc_f_vec,
     calc_rh,
+    calc_rh_vec,
     calc_u,
+    calc_u_vec,
     check_dimensions,
+    get_max_slopes,
     max_filling,
     max_slope,
     max_slopes,
     max_velocity,
     min_slope,
+    min_slope_vec,
     min_velocity,
 )
 from stormwater_analysis.utils.lazy_object import LazyObject
 
+_F_INPUTS = np.array([(0, 1), (0, 2), (0, 0.5), (0, 0.2), (1, 1), (2, 2), (0.5, 0.5), (0.1, 0.2), (0.5, 1), (1, 2), (0.25, 0.5)])
+_F_EXPECTED = np.array(
+    [
+        0,
+        0,
+        0,
+        0,
+        0.7853981633974483,
+        3.141592653589793,
+        0.19634954084936207,
+        0.015707963267948967,
+        0.39269908169872414,
+        1.5707963267948966,
+        0.09817477042468103,
+    ]
+)
+
+_MIN_SLOPE_CASES = np.array(
+    [
+        (0.1, 1.0, 2.4071926038740865),
+        (0.2, 1.0, 1.2679613277936983),
+        (0.3, 1.0, 0.8944912435239528),
+        (0.4, 1.0, 0.7137552908970533),
+        (0.5, 1.0, 0.6116207951070336),
+        (0.6, 1.0, 0.550723538128701),
+        (0.7, 1.0, 0.5161624734677323),
+        (0.8, 1.0, 0.5026580734069008),
+        (0.9, 1.0, 0.5130415616498445),
+        (0.1, 2.0, 2.348685545379234),
+        (0.2, 2.0, 1.2035963019370433),
+        (0.3, 2.0, 0.8231546097405654),
+        (0.4, 2.0, 0.6339806638968492),
+        (0.5, 2.0, 0.5214128935469622),
+        (0.6, 2.0, 0.4472456217619764),
+        (0.7, 2.0, 0.39512094038839024),
+        (0.8, 2.0, 0.3568776454485266),
+        (0.9, 2.0, 0.3280021275695537),
+    ],
+    dtype=np.float64,
+)
+_MAX_SLOPE_CASES = np.array(
+    [
+        (0.2, 232.42),
+        (0.3, 134.56),
+        (0.4, 91.74),
+        (0.5, 67.89),
+        (0.6, 54.03),
+        (0.7, 43.25),
+        (0.8, 36.03),
+        (0.9, 30.75),
+        (1.0, 26.8),
+    ],
+    dtype=np.float64,
+)
+
 
 class TestCheckDimensions:
     def test_check_dimensions_filling_and_diameter_equal(self):
@@ -125,20 +185,15 @@ class TestMaxFilling:
         Tests that the function `max_filling` returns the correct value
         for three different inputs
         """
-        assert math.isclose(max_filling(0.2), 0.1654, rel_tol=1e-4)
-        assert math.isclose(max_filling(1.0), 0.827, rel_tol=1e-4)
-        assert math.isclose(max_filling(2.0), 1.654, rel_tol=1e-4)
+        np.testing.assert_allclose(max_filling(np.array([0.2, 1.0, 2.0])), np.array([0.1654, 0.827, 1.654]), rtol=1e-4)
 
     def test_max_filling_valid_values(self):
         """
         Check if max_filling takes a diameter and returns
         the maximum filling for that diameter
         """
-        for val, dia in zip(
-            [0.165, 0.248, 0.331, 0.414, 0.496, 0.579, 0.662, 0.744, 0.827],
-            np.arange(0.2, 1, 0.1),
-        ):
-            assert pytest.approx(val) == round(max_filling(dia), 3)
+        expected = np.array([0.165, 0.248, 0.331, 0.414, 0.496, 0.579, 0.662, 0.744, 0.827])
+        np.testing.assert_allclose(np.round(max_filling(np.linspace(0.2, 1.0, 9)), 3), expected)
 
     def test_invalid_input(self):
         """
@@ -152,6 +207,8 @@ class TestMaxFilling:
             max_filling(0.1)
         with pytest.raises(ValueError):
             max_filling(3.0)
+        with pytest.raises(ValueError):
+            max_filling(np.array([0.5, 3.0]))
 
 
 class TestMaxVelocity:
@@ -177,45 +234,63 @@ class TestCalcF:
     Class contain tests the calc_f function.
     """
 
-    def test_calc_f_zero_filling(self):
+    @pytest.fixture(scope="class")
+    def f_result(self):
+        """
+        Cross-sectional areas for `_F_INPUTS`, calculated once for the whole class.
+        """
+        return calc_f_vec(_F_INPUTS[:, 0], _F_INPUTS[:, 1])
+
+    def test_calc_f_zero_filling(self, f_result):
         """
         Test if calc_f returns 0 when the second argument is 0
         """
-        assert calc_f(0, 1) == 0
-        assert calc_f(0, 2) == 0
-        assert calc_f(0, 0.5) == 0
-        assert calc_f(0, 0.2) == 0
+        np.testing.assert_array_equal(f_result[:4], _F_EXPECTED[:4])
 
-    def test_calc_f_filling_equal_diameter(self):
+    def test_calc_f_filling_equal_diameter(self, f_result):
         """
         Test if calc_f calculates the filling factor of a circle with a
         given diameter and a given hole diameter
         """
-        assert calc_f(1, 1) == 0.7853981633974483
-        assert calc_f(2, 2) == 3.141592653589793
-        assert calc_f(0.5, 0.5) == 0.19634954084936207
-        assert calc_f(0.1, 0.2) == 0.015707963267948967
+        np.testing.assert_array_equal(f_result[4:8], _F_EXPECTED[4:8])
 
-    def test_calc_f_filing_equal_radius(self):
+    def test_calc_f_filing_equal_radius(self, f_result):
         """
         Test if calc_f calculates the angle of the arc of a circle with a
         given radius and chord length
         """
-        assert calc_f(0.5, 1) == 0.39269908169872414
-        assert calc_f(1, 2) == 1.5707963267948966
-        assert calc_f(0.25, 0.5) == 0.09817477042468103
-        assert calc_f(0.1, 0.2) == 0.015707963267948967
+        np.testing.assert_array_equal(f_result[7:], _F_EXPECTED[7:])
+
+    def test_calc_f_scalar_matches_vectorized(self, f_result):
+        """
+        Test if the scalar calc_f returns exactly the same values as calc_f_vec
+        """
+        assert [calc_f(filling, diameter) for filling, diameter in _F_INPUTS.tolist()] == f_result.tolist()
+
+    @pytest.mark.parametrize("ratio", [0.001, 0.999])
+    @pytest.mark.parametrize("diameter", [0.2, 1.0, 2.0])
+    def test_calc_f_nearly_empty_and_full(self, ratio, diameter):
+        """
+        Test if calc_f matches the circular segment area for nearly empty and nearly full pipes
+        """
+        radius, filling = diameter / 2, ratio * diameter
+        expected = radius**2 * math.acos((radius - filling) / radius) - (radius - filling) * math.sqrt(
+            2 * radius * filling - filling**2
+        )
+        assert math.isclose(calc_f(filling, diameter), expected, rel_tol=1e-9)
+        assert math.isclose(calc_f_vec(np.array([filling]), np.array([diameter]))[0], expected, rel_tol=1e-9)
 
-    def test_calc_f_filing_greater_than_radius(self):
+    @pytest.mark.parametrize(
+        "args",
+        [(1.5, 1), (2.5, 2), (0.75, 0.5), (0.4, 0.3), (3, 1), (4, 2), (1.1, 1), (-1, 1), (-0.5, 0.5)],
+    )
+    def test_calc_f_raises_value_error(self, args):
         """
-        Test if calc_f function raises a ValueError when the filing_radius
-        is greater than the radius
+        Test if calc_f raises a ValueError when the filling is greater
+        than the diameter or less than zero
         """
         with pytest.raises(ValueError):
-            calc_f(1.5, 1)
-            calc_f(2.5, 2)
-            calc_f(0.75, 0.5)
-            calc_f(0.4, 0.3)
+            calc_f(*args)
 
     def test_calc_f_raises_exception(self):
         """
@@ -229,27 +304,6 @@ class TestCalcF:
         with pytest.raises(TypeError):
             calc_f(1.5, "2.5")  # type: ignore
 
-    def test_calc_f_filing_greater_than_diameter(self):
-        """
-        Test if calc_f() raises a ValueError if the filing
-        diameter is greater than the pipe diameter
-        """
-        with pytest.raises(ValueError):
-            calc_f(3, 1)
-        with pytest.raises(ValueError):
-            calc_f(4, 2)
-        with pytest.raises(ValueError):
-            calc_f(1.1, 1)
-
-    def test_calc_f_filling_less_than_zero(self):
-        """
-        Test if calc_f raises a `ValueError` when the filling is less than zero
-        """
-        with pytest.raises(ValueError):
-            calc_f(-1, 1)
-        with pytest.raises(ValueError):
-            calc_f(-0.5, 0.5)
-
 
 class TestCalcU:
     """
@@ -260,13 +314,24 @@ class TestCalcU:
         """
         Test if calc_u function with valid input
         """
-        assert round(calc_u(1, 2), 3) == 3.142
+        assert calc_u(1, 2) == pytest.approx(3.142, abs=5e-4)
 
     def test_calc_u_with_zero_filling(self):
         """
         Test if calc_u work with zero filling
         """
-        assert round(calc_u(0, 2), 3) == 0
+        assert calc_u(0, 2) == pytest.approx(0, abs=5e-4)
+
+    @pytest.mark.parametrize("ratio", [0.001, 0.999])
+    @pytest.mark.parametrize("diameter", [0.2, 1.0, 2.0])
+    def test_calc_u_nearly_empty_and_full(self, ratio, diameter):
+        """
+        Test if calc_u matches the wetted arc length for nearly empty and nearly full pipes
+        """
+        radius, filling = diameter / 2, ratio * diameter
+        expected = diameter * math.acos((radius - filling) / radius)
+        assert math.isclose(calc_u(filling, diameter), expected, rel_tol=1e-9)
+        assert math.isclose(calc_u_vec(np.array([filling]), np.array([diameter]))[0], expected, rel_tol=1e-9)
 
     def test_calc_u_with_filling_above_radius(self):
         """
@@ -331,40 +396,33 @@ class TestCalcRh:
     Class contain tests the calc_rh function.
     """
 
+    def test_calc_rh(self):
+        """
+        Test the calc_rh function with arrays of valid input arguments.
+        """
+        filling, diameter, expected = np.array([(0.3, 0.3, 0.075), (0.5, 1.0, 0.25), (1, 2, 0.5)]).T
+        np.testing.assert_array_equal(calc_rh(filling, diameter), expected)
+
     @pytest.mark.parametrize(
         "filling, diameter, expected",
         [
             (1.0, 0.5, ValueError),
-            (0.3, 0.3, 0.075),
-            (0.5, 1.0, 0.25),
             (2.5, 1.0, ValueError),
             (0.1, 0.1, ValueError),
             (3, "two", TypeError),
-            (1, 2, 0.5),
         ],
     )
-    def test_calc_rh(self, filling, diameter, expected):
+    def test_calc_rh_raises(self, filling, diameter, expected):
         """
-        Test the calc_rh function with various input arguments.
+        Test the calc_rh function raises the expected exception for invalid input arguments.
 
         Args:
             filling (float or int): the filling height of the pipe, in meters.
-            diameter (float or int): the diameter of the pipe, in meters.
-            expected: the expected output of the function
-            for the given input arguments.
-                      If it is a type, it indicates
-                      the expected exception type.
-
-        Raises:
-            AssertionError: if the actual output of the function does not match
-                             the expected output, or if it does not raise the
-                             expected exception.
-        """
-        if isinstance(expected, type) and issubclass(expected, Exception):
-            with pytest.raises(expected):
-                calc_rh(filling, diameter)
-        else:
-            assert calc_rh(filling, diameter) == expected
+            diameter (float, int or str): the diameter of the pipe, in meters.
+            expected: the expected exception type.
+        """
+        with pytest.raises(expected):
+            calc_rh(filling, diameter)
 
     def test_calc_rh_valid_input(self):
         """
@@ -420,10 +478,10 @@ class TestMinSlope:
     """
 
     def test_min_slope_filling_greater_than_0_3(self):
-        assert round(min_slope(0.4, 1.0), 2) == 0.71
+        assert min_slope(0.4, 1.0) == pytest.approx(0.71, abs=5e-3)
 
     def test_min_slope_filling_less_than_or_equal_to_0_3(self):
-        assert round(min_slope(0.2, 1.0), 2) == 1.27
+        assert min_slope(0.2, 1.0) == pytest.approx(1.27, abs=5e-3)
 
     def test_min_slope_invalid_filling_value(self):
         with pytest.raises(ValueError):
@@ -438,42 +496,24 @@ class TestMinSlope:
             min_slope(2.0, 0.1)
 
     def test_min_slope_valid_filling_and_diameter_values(self):
-        assert round(min_slope(0.5, 1.0), 2) == 0.61
+        assert min_slope(0.5, 1.0) == pytest.approx(0.61, abs=5e-3)
 
     def test_min_slope_with_theta_and_g_values(self):
-        assert round(min_slope(0.5, 1.0, theta=1.2, g=9.81), 2) == 0.49
+        assert min_slope(0.5, 1.0, theta=1.2, g=9.81) == pytest.approx(0.49, abs=5e-3)
 
-    @pytest.mark.parametrize(
-        "filling, diameter, expected",
-        [
-            (0.1, 1.0, 2.4071926038740865),
-            (0.2, 1.0, 1.2679613277936983),
-            (0.3, 1.0, 0.8944912435239528),
-            (0.4, 1.0, 0.7137552908970533),
-            (0.5, 1.0, 0.6116207951070336),
-            (0.6, 1.0, 0.550723538128701),
-            (0.7, 1.0, 0.5161624734677323),
-            (0.8, 1.0, 0.5026580734069008),
-            (0.9, 1.0, 0.5130415616498445),
-            (0.1, 2.0, 2.348685545379234),
-            (0.2, 2.0, 1.2035963019370433),
-            (0.3, 2.0, 0.8231546097405654),
-            (0.4, 2.0, 0.6339806638968492),
-            (0.5, 2.0, 0.5214128935469622),
-            (0.6, 2.0, 0.4472456217619764),
-            (0.7, 2.0, 0.39512094038839024),
-            (0.8, 2.0, 0.3568776454485266),
-            (0.9, 2.0, 0.3280021275695537),
-        ],
-    )
-    def test_min_slope(self, filling, diameter, expected):
-        assert min_slope(filling, diameter) == pytest.approx(expected, rel=1e-3)
+    def test_min_slope(self):
+        filling, diameter, expected = _MIN_SLOPE_CASES.T
+        np.testing.assert_allclose(min_slope(filling, diameter), expected, rtol=1e-3)
+
+    def test_min_slope_invalid_array(self):
+        with pytest.raises(ValueError):
+            min_slope(np.array([0.4, 2.0]), np.array([1.0, 1.0]))
 
     def test_min_slope_with_custom_theta(self):
-        assert min_slope(0.4, 1.0, theta=2.0) == pytest.approx(0.9516737211960711, rel=1e-3)
+        assert math.isclose(min_slope(0.4, 1.0, theta=2.0), 0.9516737211960711, rel_tol=1e-3)
 
     def test_min_slope_with_custom_g(self):
-        assert min_slope(0.4, 1.0, g=10.0) == pytest.approx(0.7001939403700093, rel=1e-3)
+        assert math.isclose(min_slope(0.4, 1.0, g=10.0), 0.7001939403700093, rel_tol=1e-3)
 
     def test_min_slope_with_invalid_input(self):
         with pytest.raises(TypeError):
@@ -485,25 +525,19 @@ class TestMaxSlope:
     Class contain tests the max_slope function.
     """
 
-    @pytest.mark.parametrize(
-        "diameter, expected",
-        [
-            (0.2, 232.42),
-            (0.3, 134.56),
-            (0.4, 91.74),
-            (0.5, 67.89),
-            (0.6, 54.03),
-            (0.7, 43.25),
-            (0.8, 36.03),
-            (0.9, 30.75),
-            (1.0, 26.8),
-        ],
-    )
-    def test_max_slope_with_valid_input(self, diameter, expected):
+    def test_max_slope_with_valid_input(self):
         """
         Test the `max_slope` function with valid input.
         """
-        assert round(max_slope(diameter), 2) == expected
+        diameter, expected = _MAX_SLOPE_CASES.T
+        np.testing.assert_allclose(max_slope(diameter), expected, rtol=0, atol=5e-3)
+
+    def test_max_slope_array_matches_scalar(self):
+        """
+        Test the `max_slope` function returns the same values for an array as for each diameter.
+        """
+        diameters = np.round(np.arange(0.2, 2.01, 0.05), 2)
+        assert max_slope(diameters).tolist() == [max_slope(float(diameter)) for diameter in diameters]
 
     def test_max_slope_with_negative_diameter(self):
         """
@@ -511,6 +545,8 @@ class TestMaxSlope:
         """
         with pytest.raises(ValueError):
             max_slope(-0.3)
+        with pytest.raises(ValueError):
+            max_slope(np.array([0.3, -0.3]))
 
     def test_max_slope_with_non_numeric_input(self):
         """
@@ -533,25 +569,83 @@ class TestMaxSlope:
         with pytest.raises(ValueError):
             max_slope(0.001)
 
-    def test_max_slopes_with_valid_input(self):
+    def test_max_slopes_with_valid_input(self, max_slopes_realized):
         """
         Test the `max_slopes` object with valid input.
         """
-        assert round(max_slopes["0.2"], 2) == 232.42
-        assert round(max_slopes["0.3"], 2) == 134.56
-        assert round(max_slopes["0.4"], 2) == 91.74
-        assert round(max_slopes["0.5"], 2) == 67.89
-        assert round(max_slopes["0.6"], 2) == 54.03
-        assert round(max_slopes["0.7"], 2) == 43.25
-        assert round(max_slopes["0.8"], 2) == 36.03
-        assert round(max_slopes["0.9"], 2) == 30.75
-        assert round(max_slopes["1.0"], 2) == 26.8
-        assert round(max_slopes["1.2"], 2) == 21.15
-        assert round(max_slopes["1.5"], 2) == 15.7
-        assert round(max_slopes["2.0"], 2) == 10.7
+        keys = ("0.2", "0.3", "0.4", "0.5", "0.6", "0.7", "0.8", "0.9", "1.0", "1.2", "1.5", "2.0")
+        expected = np.array([232.42, 134.56, 91.74, 67.89, 54.03, 43.25, 36.03, 30.75, 26.8, 21.15, 15.7, 10.7])
+        values = np.array([max_slopes_realized[key] for key in keys])
+        np.testing.assert_allclose(values, expected, rtol=0, atol=5e-3)
 
     def test_max_sopes_isinstance_lazy_object(self):
         """
         Test the `max_slopes` object type.
         """
         assert isinstance(max_slopes, LazyObject) is True
+
+    def test_get_max_slopes(self):
+        """
+        Test `get_max_slopes` returns the same read-only mapping as `max_slopes` on every call.
+        """
+        slopes = get_max_slopes()
+        assert slopes is get_max_slopes()
+        assert dict(slopes) == {key: max_slopes[key] for key in max_slopes.keys()}
+        with pytest.raises(TypeError):
+            slopes["0.2"] = 0  # type: ignore
+
+
+class TestVectorized:
+    """
+    Class contain tests the array versions of calc_f, calc_u, calc_rh and min_slope.
+    """
+
+    diameters = np.repeat([0.2, 0.3, 0.5, 1.0, 1.5, 2.0], 11)
+    fillings = diameters * np.tile(np.linspace(0, 1, 11), 6)
+
+    @pytest.mark.parametrize(
+        "vec_func, func",
+        [
+            (calc_f_vec, calc_f),
+            (calc_u_vec, calc_u),
+            (calc_rh_vec, calc_rh),
+        ],
+    )
+    def test_matches_scalar(self, vec_func, func):
+        """
+        Test the array functions return the same values as the scalar ones, including empty, half-full and full pipes.
+        """
+        expected = [func(float(f), float(d)) for f, d in zip(self.fillings, self.diameters)]
+        np.testing.assert_allclose(vec_func(self.fillings, self.diameters), expected, rtol=1e-12, atol=1e-12)
+
+    def test_min_slope_matches_scalar(self):
+        """
+        Test `min_slope_vec` returns the same values as `min_slope`, and inf for empty pipes.
+        """
+        filled = self.fillings > 0
+        expected = [min_slope(float(f), float(d)) for f, d in zip(self.fillings[filled], self.diameters[filled])]
+        result = min_slope_vec(self.fillings, self.diameters)
+        np.testing.assert_allclose(result[filled], expected, rtol=1e-12)
+        assert np.isinf(result[~filled]).all()
+
+    def test_min_slope_empty_pipe(self):
+        """
+        Test `min_slope` returns inf for an empty pipe, for scalars and arrays alike.
+        """
+        assert min_slope(0, 0.5) == math.inf
+        assert min_slope(np.array([0.0]), np.array([0.5]))[0] == math.inf
+
+    @pytest.mark.parametrize(
+        "filling, diameter",
+        [
+            ([0.3, 0.6], [0.5, 0.5]),
+            ([0.1, 0.1], [0.5, 0.1]),
+            ([0.1, 2.5], [0.5, 3.0]),
+        ],
+    )
+    def test_invalid_dimensions(self, filling, diameter):
+        """
+        Test the array functions raise ValueError if any of the values is invalid.
+        """
+        with pytest.raises(ValueError):
+            calc_rh_vec(np.array(filling), np.array(diameter))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from stormwater_analysis.pipes.valid_round import validate_filling, validate_filling_batch
+
+_DIAMETERS = (0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+_VALID_CASES = tuple(zip((0.16, 0.20, 0.30, 0.40, 0.45, 0.50, 0.60, 0.70, 0.80), _DIAMETERS))
+_INVALID_CASES = tuple(zip((0.19, 0.26, 0.35, 0.45, 0.50, 0.60, 0.70, 0.80, 0.90), _DIAMETERS))
+
+
+class TestValidateMaxFilling:
+    """
+    Tests for validate_max_filling function.
+    """
+
+    @pytest.mark.parametrize(("fill", "dia"), _VALID_CASES, ids=[f"fill{fill}-d{dia}" for fill, dia in _VALID_CASES])
+    def test_max_filling_valid_values(self, fill, dia):
+        """
+        Tests if validate_max_filling function returns True for valid values.
+        """
+        assert validate_filling(fill, dia)
+
+    @pytest.mark.parametrize(("fill", "dia"), _INVALID_CASES, ids=[f"fill{fill}-d{dia}" for fill, dia in _INVALID_CASES])
+    def test_max_filling_invalid_values(self, fill, dia):
+        """
+        Tests if validate_max_filling function returns False
+        for invalid values.
+        """
+        assert not validate_filling(fill, dia)
+
+    @pytest.mark.parametrize("dia", _DIAMETERS, ids=[f"d{dia}" for dia in _DIAMETERS])
+    def test_max_filling_zero(self, dia):
+        """
+        Tests if validate_max_filling function returns False for zero value.
+        """
+        assert validate_filling(0, dia)
+
+    def test_max_filling_batch(self):
+        """
+        Tests if validate_filling_batch function checks all the valid and invalid values in one call.
+        """
+        valid_fills, valid_dias = np.array(_VALID_CASES).T
+        invalid_fills, invalid_dias = np.array(_INVALID_CASES).T
+        assert validate_filling_batch(valid_fills, valid_dias).all()
+        assert not validate_filling_batch(invalid_fills, invalid_dias).any()
+        assert validate_filling_batch(np.zeros(len(_DIAMETERS)), np.array(_DIAMETERS)).all()
+        with pytest.raises(ValueError):
+            validate_filling_batch(np.array([0.1, 2.0]), np.array([0.3, 3.0]))
+
+    @pytest.mark.validation_errors
+    def test_max_filling_invalid_diameter(self):
+        """
+        Tests if validate_max_filling function raise ValueError
+        for invalid diameter.
+        """
+        with pytest.raises(ValueError):
+            validate_filling(2, 3.0)
+
+    @pytest.mark.validation_errors
+    def test_max_filling_invalid_value(self):
+        """
+        Tests if validate_max_filling function raise ValueError
+        for negative value.
+        """
+        with pytest.raises(ValueError):
+            validate_filling(1, -2)
+        # with pytest.raises(ValueError):
+        #     validate_filling(-1, 1)
+
+    @pytest.mark.validation_errors
+    @pytest.mark.parametrize("val", ("", "four", [], {}))
+    def test_max_filling_invalid_types(self, val):
+        """
+        Tests if validate_max_filling function raise TypeError
+        for invalid types.
+        """
+        with pytest.raises(TypeError):
+            validate_filling(val, 1)  # type: ignore
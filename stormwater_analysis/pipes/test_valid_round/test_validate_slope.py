@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from stormwater_analysis.pipes.valid_round import validate_max_slope, validate_max_slope_batch, validate_min_slope
+
+_MIN_SLOPE_VALID = (
+    (5.0, 0.10, 0.2),
+    (2.5, 0.20, 0.3),
+    (2.5, 0.30, 0.4),
+    (2.5, 0.40, 0.5),
+    (2.5, 0.45, 0.6),
+    (2.5, 0.50, 0.7),
+    (2.5, 0.60, 0.8),
+    (2.5, 0.70, 0.9),
+    (2.5, 0.80, 1.0),
+)
+_MIN_SLOPE_NEG = tuple((-slope, filling, diameter) for slope, filling, diameter in _MIN_SLOPE_VALID)
+_MAX_SLOPE_CASES = ((0.1, 0.3, True), (250, 0.2, False), (0.7, 0.7, True), (1.5, 1.2, True), (1, 1.5, True))
+
+
+class TestValidateMinSlope:
+    """
+    Tests for validate_min_slope function.
+    """
+
+    @pytest.mark.parametrize(("slope", "filling", "diameter"), _MIN_SLOPE_VALID)
+    def test_valid_slope(self, slope, filling, diameter):
+        """
+        Test the `validate_min_slope` function with valid input.
+        """
+        assert validate_min_slope(slope, filling, diameter)
+
+    @pytest.mark.parametrize(("slope", "filling", "diameter"), _MIN_SLOPE_NEG)
+    def test_valid_negative_slope(self, slope, filling, diameter):
+        """
+        Test the `validate_min_slope` function with negative slope.
+        """
+        assert not validate_min_slope(slope, filling, diameter)
+
+    def test_invalid_slope(self):
+        """
+        Test the `validate_min_slope` function with invalid slope.
+        """
+        assert not validate_min_slope(0.5, 0.3, 0.5, 1.5, 9.81)
+
+    def test_valid_slope_with_different_theta(self):
+        """
+        Test the `validate_min_slope` function
+        with valid slope and different theta.
+        """
+        assert validate_min_slope(2.5, 0.2, 0.3, 1.0, 9.81)
+
+    def test_valid_slope_with_different_diameter(self):
+        """
+        Test the `validate_min_slope` function
+        with valid slope and different diameter.
+        """
+        assert validate_min_slope(1.2, 0.5, 0.6, 1.5, 9.81)
+
+    def test_valid_slope_with_different_gravity(self):
+        """
+        Test the `validate_min_slope` function with valid
+        slope and different gravity.
+        """
+        assert validate_min_slope(1.2, 0.5, 0.7, 1.5, 10)
+
+    def test_invalid_slope_with_different_gravity(self):
+        """
+        Test the `validate_min_slope` function
+        with invalid slope and different gravity.
+        """
+        assert validate_min_slope(1.0, 0.5, 0.7, 1.5, 8.81)
+
+    def test_invalid_slope_with_negative_filling(self):
+        """
+        Test the `validate_min_slope` function
+        with invalid slope and negative filling.
+        """
+        with pytest.raises(ValueError):
+            validate_min_slope(0.5, -0.5, 0.3, 1.5, 9.81)
+
+    def test_invalid_slope_with_negative_diameter(self):
+        """
+        Test the `validate_min_slope` function
+        with invalid slope and negative diameter.
+        """
+        with pytest.raises(ValueError):
+            validate_min_slope(0.5, 0.5, -0.3, 1.5, 9.81)
+
+
+class TestValidMaxSlope:
+    """
+    Tests for validate_max_slope function.
+    """
+
+    @pytest.mark.parametrize(("slope", "diameter", "expected"), _MAX_SLOPE_CASES)
+    def test_validate_max_slope(self, slope, diameter, expected):
+        """
+        Test the `validate_max_slope` function with valid input.
+        """
+        assert validate_max_slope(slope, diameter) is expected
+
+    def test_validate_max_slope_batch(self):
+        """
+        Test the `validate_max_slope_batch` function checks all the valid input in one call.
+        """
+        slopes, diameters, expected = zip(*_MAX_SLOPE_CASES)
+        np.testing.assert_array_equal(validate_max_slope_batch(np.array(slopes), np.array(diameters)), expected)
+
+    def test_validate_max_slope_batch_invalid(self):
+        """
+        Test the `validate_max_slope_batch` function with invalid input.
+        """
+        with pytest.raises(ValueError):
+            validate_max_slope_batch(np.array([0.5, 0]), np.array([0.6, 0.6]))
+        with pytest.raises(ValueError):
+            validate_max_slope_batch(np.array([0.5, 0.5]), np.array([0.6, 0.1]))
+
+    def test_validate_max_slope_invalid_diameter(self):
+        """
+        Test the `validate_max_slope` function with invalid input.
+        """
+        with pytest.raises(ValueError):
+            validate_max_slope(0.5, 0.1)
+
+    def test_validate_max_slope_string_diameter(self):
+        """
+        Test the `validate_max_slope` function with invalid input.
+        """
+        with pytest.raises(TypeError):
+            validate_max_slope(0.5, "0.8")  # type: ignore
+
+    def test_validate_max_slope_string_slope(self):
+        """
+        Test the `validate_max_slope` function with invalid input.
+        """
+        with pytest.raises(TypeError):
+            validate_max_slope("0.5", 0.8)  # type: ignore
+
+    def test_validate_max_slope_negative_slope(self):
+        """
+        Test the `validate_max_slope` function with invalid input.
+        """
+        with pytest.raises(ValueError):
+            validate_max_slope(-0.5, 1.0)
+
+    def test_validate_max_slope_zero_slope(self):
+        """
+        Test the `validate_max_slope` function with invalid input.
+        """
+        with pytest.raises(ValueError):
+            validate_max_slope(0, 0.6)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from stormwater_analysis.pipes.valid_round import (
+    max_velocity_value,
+    validate_max_velocity,
+    validate_min_velocity,
+    validate_min_velocity_batch,
+)
+
+_MAX_V = max_velocity_value
+_MIN_V_CASES = ((0.7, True), (0.6, False), (0.8, True), (-0.7, False), (0, False), (_MAX_V, True), (0.701, True), (0.699, False))
+
+
+class TestValidateMaxVelocity:
+    """
+    Tests for validate_max_velocity function.
+    """
+
+    def test_velocity_below_max_velocity(self):
+        """
+        Tests if validate_max_velocity function returns True
+        for values below max velocity.
+        """
+        assert validate_max_velocity(3.0)
+
+    def test_velocity_equal_to_max_velocity(self):
+        """
+        Tests if validate_max_velocity function returns True
+        for values equal to max velocity.
+        """
+        assert validate_max_velocity(_MAX_V)
+
+    def test_velocity_slightly_above_max_velocity(self):
+        """
+        Tests if validate_max_velocity function returns False
+        for values slightly above max velocity.
+        """
+        assert not validate_max_velocity(_MAX_V + 0.001)
+
+    def test_velocity_above_max_velocity(self):
+        """
+        Tests if validate_max_velocity function returns False
+        for values above max velocity.
+        """
+        assert not validate_max_velocity(15.0)
+
+    def test_velocity_is_float(self):
+        """
+        Tests if validate_max_velocity function raises TypeError
+        for non-float values.
+        """
+        with pytest.raises(TypeError):
+            validate_max_velocity("10.0")  # type: ignore
+
+    def test_velocity_is_not_none(self):
+        """
+        Tests if validate_max_velocity function raises ValueError
+        for None values.
+        """
+        with pytest.raises(TypeError):
+            validate_max_velocity(None)  # type: ignore
+
+
+class TestValidateMinVelocity:
+    """
+    Tests for validate_min_velocity function.
+    """
+
+    @pytest.mark.parametrize(("velocity", "expected"), _MIN_V_CASES, ids=[f"v{velocity}" for velocity, _ in _MIN_V_CASES])
+    def test_validate_min_velocity(self, velocity, expected):
+        """
+        Tests if validate_min_velocity function returns True only for values
+        equal to or above min velocity, including values slightly below and above it.
+        """
+        assert validate_min_velocity(velocity) is expected
+
+    def test_validate_min_velocity_batch(self):
+        """
+        Tests if validate_min_velocity_batch function checks all the values in one call.
+        """
+        velocities, expected = zip(*_MIN_V_CASES)
+        np.testing.assert_array_equal(validate_min_velocity_batch(np.array(velocities)), expected)
+
+    def test_validate_min_velocity_string_value(self):
+        """
+        Tests if validate_min_velocity function raises TypeError
+        for string values.
+        """
+        with pytest.raises(TypeError):
+            validate_min_velocity("10.0")  # type: ignore
@@ -1,9 +1,12 @@
 import logging
 
+import numpy as np
+
 from stormwater_analysis.pipes.round import (
     check_dimensions,
+    get_max_slopes,
     max_filling,
-    max_slopes,
+    max_slope_vec,
     max_velocity_value,
     min_slope,
     min_velocity_value,
@@ -26,6 +29,20 @@ def validate_filling(filling: float, diameter: float) -> bool:
     return filling <= max_filling(diameter)
 
 
+def validate_filling_batch(filling: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    """
+    Check that the maximum filling is not exceeded, for arrays of pipes.
+
+    Args:
+        filling (np.ndarray): pipe filling heights [m].
+        diameter (np.ndarray): pipe diameters [m].
+
+    Return:
+        np.ndarray: boolean array, True where the filling is lower than the maximum filling.
+    """
+    return np.asarray(filling, dtype=np.float64) <= max_filling(np.asarray(diameter, dtype=np.float64))
+
+
 def validate_max_velocity(velocity: float) -> bool:
     """
     Check that the maximum velocity is not exceeded.
@@ -56,6 +73,19 @@ def validate_min_velocity(velocity: float) -> bool:
     return velocity >= min_velocity_value  # type: ignore
 
 
+def validate_min_velocity_batch(velocity: np.ndarray) -> np.ndarray:
+    """
+    Check that the minimum velocity is not exceeded, for arrays of pipes, see `validate_min_velocity`.
+
+    Args:
+        velocity (np.ndarray): flow velocities in the sewers [m/s].
+
+    Return:
+        np.ndarray: boolean array, True where the velocity is higher than the minimum velocity.
+    """
+    return np.asarray(velocity, dtype=np.float64) >= min_velocity_value
+
+
 def check_slope(slope: float) -> bool:
     """
     Check passed value for slope.
@@ -70,11 +100,18 @@ def check_slope(slope: float) -> bool:
         TypeError: if slope is not a float or int.
         ValueError: if slope is not positive.
     """
+    if _check_slope_ok(slope):
+        return True
     if not isinstance(slope, (int, float)):
         raise TypeError(f"slope must be a float or int, not {type(slope)}")
-    if slope <= 0:
-        raise ValueError(f"slope must be positive, not {slope}")
-    return True
+    raise ValueError(f"slope must be positive, not {slope}")
+
+
+def _check_slope_ok(slope: float) -> bool:
+    """
+    Check passed value for slope like `check_slope`, but return False instead of raising.
+    """
+    return isinstance(slope, (int, float)) and not slope <= 0
 
 
 def validate_min_slope(
@@ -109,5 +146,28 @@ def validate_max_slope(slope: float, diameter: float) -> bool:
     Check that the maximum slope is not exceeded.
     """
     if check_slope(slope) and check_dimensions(diameter, diameter):
-        return slope <= max_slopes.get(str(diameter))  # type: ignore
+        return slope <= get_max_slopes().get(str(diameter))  # type: ignore
     return False
+
+
+def validate_max_slope_batch(slope: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    """
+    Check that the maximum slope is not exceeded, for arrays of pipes, see `validate_max_slope`.
+
+    The maximum slope is calculated once for each distinct diameter.
+
+    Args:
+        slope (np.ndarray): pipe slopes.
+        diameter (np.ndarray): pipe diameters [m].
+
+    Return:
+        np.ndarray: boolean array, True where the slope is lower than the maximum slope.
+
+    Raises:
+        ValueError: if any slope is not positive, or any diameter is not between 0.2 and 2.0 meters.
+    """
+    slope = np.asarray(slope, dtype=np.float64)
+    if not np.all(slope > 0):
+        raise ValueError("slopes must be positive")
+    unique_diameters, inverse = np.unique(np.asarray(diameter, dtype=np.float64), return_inverse=True)
+    return slope <= max_slope_vec(unique_diameters)[inverse]
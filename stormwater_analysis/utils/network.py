@@ -0,0 +1,187 @@
+"""
+Tracing of the conduits network.
+
+Kept free of the data and model modules, so that worker processes tracing the network import only numpy and pandas.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Smaller networks are traced serially, faster than starting worker processes.
+_PARALLEL_TRACES_MIN_OUTFALLS = 32
+_PARALLEL_TRACES_MIN_CONDUITS = 100_000
+
+# Network shared with the worker processes of `trace_outfalls`, set once per worker by `_init_trace_worker`.
+_worker_network: Dict[str, object] = {}
+
+
+def build_upstream_adjacency(conduits: pd.DataFrame) -> Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Builds the upstream adjacency of the conduits network in CSR form.
+
+    Nodes are numbered by their position in the returned `nodes` index. The conduits entering node `i`
+    are the conduit rows `indices[indptr[i]:indptr[i + 1]]`, kept in dataframe order.
+
+    Args:
+        conduits (pd.DataFrame): The conduits dataframe with 'InletNode' and 'OutletNode' columns.
+
+    Returns:
+        Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]: The nodes index, `indptr`, `indices`
+        and the inlet node number of every conduit row.
+    """
+    inlet_nodes = np.asarray(conduits["InletNode"], dtype=object)
+    outlet_nodes = np.asarray(conduits["OutletNode"], dtype=object)
+    codes, uniques = pd.factorize(np.concatenate([inlet_nodes, outlet_nodes]))
+    nodes = pd.Index(uniques)
+    inlet_codes, outlet_codes = codes[: len(inlet_nodes)], codes[len(inlet_nodes) :]
+    indices = np.argsort(outlet_codes, kind="stable")
+    indptr = np.searchsorted(outlet_codes[indices], np.arange(len(nodes) + 1))
+    return nodes, indptr, indices, inlet_codes
+
+
+def trace_upstream(
+    conduits: pd.DataFrame,
+    startnode: str,
+    adjacency: Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray],
+) -> Dict[str, List[str]]:
+    """
+    Traces the network upstream of `startnode` using a precomputed adjacency.
+
+    Gives the same result as `swmmio.utils.functions.trace_from_node(conduits, startnode)`: conduits are
+    visited depth-first, in dataframe order, but each node's upstream conduits are read from the adjacency
+    instead of scanning the whole dataframe.
+
+    Args:
+        conduits (pd.DataFrame): The conduits dataframe the adjacency was built from.
+        startnode (str): The node to start tracing from, usually an outfall.
+        adjacency (Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]): The result of `build_upstream_adjacency`.
+
+    Returns:
+        Dict[str, List[str]]: The traced nodes and conduits, under the 'nodes' and 'conduits' keys.
+    """
+    nodes, indptr, indices, inlet_codes = adjacency
+    start = nodes.get_indexer([startnode])[0]
+    if start < 0:
+        return {"nodes": [startnode], "conduits": []}
+
+    # Only the rows reached from `startnode` are touched, so a trace costs time proportional to its own size.
+    traced = set()
+    rows = []
+    stack = [iter(indices[indptr[start] : indptr[start + 1]].tolist())]
+    while stack:
+        for row in stack[-1]:
+            if row not in traced:
+                traced.add(row)
+                rows.append(row)
+                node = inlet_codes[row]
+                stack.append(iter(indices[indptr[node] : indptr[node + 1]].tolist()))
+                break
+        else:
+            stack.pop()
+
+    return {"nodes": [startnode] + nodes.take(inlet_codes[rows]).tolist(), "conduits": conduits.index[rows].tolist()}
+
+
+def build_downstream_index(conduits: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Builds the downstream index of the conduits network.
+
+    Args:
+        conduits (pd.DataFrame): The conduits dataframe with 'InletNode' and 'OutletNode' columns.
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], np.ndarray]: The conduit rows leaving every node, kept in dataframe order,
+        and the outlet node of every conduit row.
+    """
+    downstream = conduits.groupby("InletNode", observed=True).indices
+    return downstream, np.asarray(conduits["OutletNode"], dtype=object)
+
+
+def trace_downstream(
+    conduits: pd.DataFrame,
+    startnode: str,
+    stopnode: Optional[str] = None,
+    downstream_index: Optional[Tuple[Dict[str, np.ndarray], np.ndarray]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Traces the network downstream of `startnode`, optionally up to `stopnode`.
+
+    Gives the same result as `swmmio.utils.functions.trace_from_node(conduits, startnode, mode="down", stopnode)`,
+    but the conduits leaving each node are looked up in a node-to-rows index instead of scanning the whole dataframe.
+
+    Args:
+        conduits (pd.DataFrame): The conduits dataframe with 'InletNode' and 'OutletNode' columns.
+        startnode (str): The node to start tracing from.
+        stopnode (Optional[str]): The node at which a branch of the trace stops.
+        downstream_index (Optional[Tuple[Dict[str, np.ndarray], np.ndarray]]): The result of `build_downstream_index`,
+            to be reused by several traces of the same network. Defaults to None, the index is then built for this trace.
+
+    Returns:
+        Dict[str, List[str]]: The traced nodes and conduits, under the 'nodes' and 'conduits' keys.
+    """
+    downstream, outlet_nodes = downstream_index if downstream_index is not None else build_downstream_index(conduits)
+    no_rows = np.empty(0, dtype=np.intp)
+
+    traced = set()
+    rows = []
+    stack = [iter(downstream.get(startnode, no_rows).tolist())]
+    while stack:
+        for row in stack[-1]:
+            if row not in traced:
+                traced.add(row)
+                rows.append(row)
+                node = outlet_nodes[row]
+                if stopnode and node == stopnode:
+                    # Like swmmio, reaching the stop node ends the search from the current node only.
+                    stack.pop()
+                else:
+                    stack.append(iter(downstream.get(node, no_rows).tolist()))
+                break
+        else:
+            stack.pop()
+
+    return {"nodes": [startnode] + outlet_nodes[rows].tolist(), "conduits": conduits.index[rows].tolist()}
+
+
+def _init_trace_worker(conduits: pd.DataFrame, adjacency: Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]) -> None:
+    _worker_network["conduits"] = conduits
+    _worker_network["adjacency"] = adjacency
+
+
+def _trace_in_worker(outfall: str) -> Dict[str, List[str]]:
+    return trace_upstream(_worker_network["conduits"], outfall, _worker_network["adjacency"])  # type: ignore
+
+
+def trace_outfalls(
+    conduits: pd.DataFrame,
+    outfalls: Sequence[str],
+    adjacency: Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray],
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Traces the network upstream of every outfall.
+
+    Traces of different outfalls are independent of each other. Tracing is pure Python, so for many outfalls
+    it is spread over worker processes rather than threads; each worker receives the network once.
+
+    Args:
+        conduits (pd.DataFrame): The conduits dataframe the adjacency was built from.
+        outfalls (Sequence[str]): The outfall IDs to trace from.
+        adjacency (Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]): The result of `build_upstream_adjacency`.
+        max_workers (Optional[int]): The number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+        Dict[str, Dict[str, List[str]]]: The trace of every outfall, keyed by the outfall ID.
+    """
+    workers = min(len(outfalls), max_workers or os.cpu_count() or 1)
+    if workers < 2 or len(outfalls) < _PARALLEL_TRACES_MIN_OUTFALLS or len(conduits) < _PARALLEL_TRACES_MIN_CONDUITS:
+        return {outfall: trace_upstream(conduits, outfall, adjacency) for outfall in outfalls}
+
+    # `trace_upstream` only reads conduit names from the dataframe, so the workers get its index alone.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_trace_worker, initargs=(conduits[[]], adjacency)) as executor:
+        traces = executor.map(_trace_in_worker, outfalls, chunksize=max(1, len(outfalls) // (4 * workers)))
+        return dict(zip(outfalls, traces))